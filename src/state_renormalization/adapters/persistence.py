@@ -1,10 +1,12 @@
 # state_renormalization/adapters/persistence.py
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
 from collections.abc import Iterator
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from pathlib import Path
 from typing import Any, Literal
 
@@ -42,14 +44,36 @@ _LINEAGE_RECORD_TIME_FIELDS: tuple[str, ...] = (
     "t_asked_iso",
 )
 
+# Known line counts per JSONL log, keyed by absolute path and valid while the file
+# identity (inode, size, mtime) matches, so appends need not re-read the whole log.
+# Bounded; the least recently appended log is evicted first.
+_JSONL_LINE_COUNTS: dict[str, tuple[tuple[int, int, int], int]] = {}
+_JSONL_LINE_COUNTS_MAX = 256
+
+
+_JSON_PRIMITIVE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+
+@functools.lru_cache(maxsize=64)
+def _dataclass_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
 
 def _to_jsonable(x: Any) -> Any:
-    if x is None:
-        return None
+    # Records are mostly plain dicts of primitives (e.g. `to_jsonable_episode` output), so
+    # primitive leaves are passed through without a recursive call.
+    x_type = type(x)
+    if x_type in _JSON_PRIMITIVE_TYPES:
+        return x
+    if x_type is dict:
+        return {
+            str(k): v if type(v) in _JSON_PRIMITIVE_TYPES else _to_jsonable(v) for k, v in x.items()
+        }
     if isinstance(x, BaseModel):
         return x.model_dump(mode="json")
     if is_dataclass(x) and not isinstance(x, type):
-        return asdict(x)
+        # Field walk instead of `asdict`, which deep-copies every leaf first.
+        return {name: _to_jsonable(getattr(x, name)) for name in _dataclass_field_names(type(x))}
     if isinstance(x, dict):
         return {str(k): _to_jsonable(v) for k, v in x.items()}
     if isinstance(x, (list, tuple)):
@@ -108,17 +132,52 @@ def _inject_stable_ids(record: JsonObj) -> JsonObj:
     return out
 
 
-def append_jsonl(path: PathLike, record: Any) -> None:
-    p = Path(path)
-    p.parent.mkdir(parents=True, exist_ok=True)
+def append_jsonl(path: PathLike, record: Any) -> int:
+    """Append one record and return its 1-based line offset (for `<name>@<offset>` refs)."""
+    return _append_jsonl_record(Path(path), record)
+
+
+def _append_jsonl_record(p: Path, record: Any) -> int:
+    """Append one record and return its 1-based line offset in the log."""
     obj = _to_jsonable(record)
     if isinstance(obj, dict):
         obj = _inject_stable_ids(obj)
+    return _append_jsonl_line(p, _encode_jsonl_line(obj))
 
+
+def _append_jsonl_line(p: Path, line: bytes) -> int:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    key = os.path.abspath(p)
+    with p.open("ab") as f:
+        before = os.fstat(f.fileno())
+        cached = _JSONL_LINE_COUNTS.get(key)
+        if cached is not None and cached[0] == _file_identity(before):
+            line_count = cached[1]
+        elif before.st_size == 0:
+            line_count = 0
+        else:
+            line_count = len(p.read_text(encoding="utf-8").splitlines())
+        f.write(line)
+        f.flush()
+        after = os.fstat(f.fileno())
+    _JSONL_LINE_COUNTS.pop(key, None)
+    # Only trust our count if the file grew by exactly our line; otherwise another writer
+    # appended concurrently and the next append recounts from disk.
+    if after.st_size - before.st_size == len(line):
+        if len(_JSONL_LINE_COUNTS) >= _JSONL_LINE_COUNTS_MAX:
+            del _JSONL_LINE_COUNTS[next(iter(_JSONL_LINE_COUNTS))]
+        written_lines = len(line.decode("utf-8").splitlines())
+        _JSONL_LINE_COUNTS[key] = (_file_identity(after), line_count + written_lines)
+    return line_count + 1
+
+
+def _file_identity(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _encode_jsonl_line(obj: Any) -> bytes:
     # enforce "one JSON object per line"
-    line = json.dumps(obj, ensure_ascii=False)
-    with p.open("a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def read_jsonl(path: PathLike) -> Iterator[tuple[JsonObj, JsonObj]]:
@@ -155,11 +214,7 @@ def append_prediction(
     if record is None:
         raise ValueError("append_prediction requires a prediction record")
     p = Path(path)
-    next_offset = 1
-    if p.exists():
-        next_offset = len(p.read_text(encoding="utf-8").splitlines()) + 1
-
-    append_jsonl(p, record)
+    next_offset = _append_jsonl_record(p, record)
     return {"kind": "jsonl", "ref": f"{p.name}@{next_offset}"}
 
 
@@ -537,9 +592,6 @@ def read_halt_record(record: JsonObj) -> HaltRecord:
 def append_halt(path: PathLike, record: Any, *, adapter_gate: CapabilityAdapterGate) -> JsonObj:
     _enforce_adapter_gate(action="append_halt", adapter_gate=adapter_gate)
     p = Path(path)
-    next_offset = 1
-    if p.exists():
-        next_offset = len(p.read_text(encoding="utf-8").splitlines()) + 1
 
     try:
         payload = _canonicalize_halt_payload(record)
@@ -559,5 +611,5 @@ def append_halt(path: PathLike, record: Any, *, adapter_gate: CapabilityAdapterG
             ],
         ) from exc
 
-    append_jsonl(p, payload)
+    next_offset = _append_jsonl_record(p, payload)
     return {"kind": "jsonl", "ref": f"{p.name}@{next_offset}"}
@@ -47,7 +47,7 @@ def normalize_text(s: str) -> str:
     return t
 
 
-EXIT_EXACT = {"quit", "exit", "q", "lopeta", "pois", "stop"}
+EXIT_EXACT = frozenset({"quit", "exit", "q", "lopeta", "pois", "stop"})
 EXIT_PHRASES = [
     "take a break",
     "pause",
@@ -57,13 +57,15 @@ EXIT_PHRASES = [
     "later",
     "leave me alone",
 ]
+# Shared with the engine's utterance classifier; one regex scan instead of a check per phrase.
+EXIT_PHRASES_RE = re.compile("|".join(map(re.escape, EXIT_PHRASES)))
 
 
 def is_exit_intent(t: str) -> bool:
     t = (t or "").strip().lower()
     if t in EXIT_EXACT:
         return True
-    return any(p in t for p in EXIT_PHRASES)
+    return EXIT_PHRASES_RE.search(t) is not None
 
 
 UNCERTAIN_PHRASES = {"not sure", "don't know", "dont know", "idk", "maybe", "perhaps", "unsure"}
@@ -4,11 +4,15 @@ from __future__ import annotations
 # Temporary integration merge-freeze marker:
 # during stabilization of integration/pr-conflict-resolution, merge changes to this
 # module only via the ordered integration stack documented in docs/integration_notes.md.
+import functools
 import hashlib
 import importlib
 import json
+import re
 import uuid
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -34,7 +38,11 @@ from state_renormalization.adapters.persistence import (
     append_prediction_record_event,
     iter_projection_lineage_records,
 )
-from state_renormalization.adapters.schema_selector import naive_schema_selector
+from state_renormalization.adapters.schema_selector import (
+    EXIT_EXACT,
+    EXIT_PHRASES_RE,
+    naive_schema_selector,
+)
 from state_renormalization.contracts import (
     AmbiguityStatus,
     AskMetrics,
@@ -104,12 +112,13 @@ from state_renormalization.invariants import (
     InvariantOutcome,
     default_check_context,
     normalize_outcome,
+    normalize_outcomes,
     repair_mode_enabled,
 )
 from state_renormalization.invariants import (
     Flow as InvariantFlow,
 )
-from state_renormalization.stable_ids import derive_stable_ids
+from state_renormalization.stable_ids import StableIds, derive_stable_ids
 
 PHATIC_PATTERNS = [
     "that's a great question",
@@ -122,16 +131,8 @@ PHATIC_PATTERNS = [
 ]
 
 
-EXIT_EXACT = {"quit", "exit", "q", "lopeta", "pois", "stop"}
-EXIT_PHRASES = [
-    "take a break",
-    "pause",
-    "stop for now",
-    "come back later",
-    "not now",
-    "later",
-    "leave me alone",
-]
+# One C-level regex scan per utterance instead of a Python-level `in` check per phrase.
+_PHATIC_PATTERNS_RE = re.compile("|".join(map(re.escape, PHATIC_PATTERNS)))
 
 
 @dataclass(frozen=True)
@@ -203,6 +204,8 @@ class GateInvariantCheck:
 class GateInvariantEvaluation:
     phase: str
     outcome: InvariantOutcome
+    # Explainable-halt check already run against `outcome` (stop outcomes only).
+    halt_validation: InvariantOutcome | None = None
 
 
 @dataclass(frozen=True)
@@ -933,15 +936,18 @@ def _evaluate_gate_phase(
     just_written_prediction: CanonicalPredictionPayload | None,
 ) -> GateInvariantEvaluation:
     phase_ctx = default_check_context(
+        now_iso=_now_iso(),
         scope=scope,
         prediction_key=prediction_key,
         current_predictions=current_predictions,
         prediction_log_available=prediction_log_available,
         just_written_prediction=just_written_prediction,
     )
+    outcome, halt_validation = _run_invariant_with_halt_validation(invariant_id, ctx=phase_ctx)
     return GateInvariantEvaluation(
         phase=phase,
-        outcome=_run_invariant(invariant_id, ctx=phase_ctx),
+        outcome=outcome,
+        halt_validation=halt_validation,
     )
 
 
@@ -963,7 +969,7 @@ def _result_from_gate_evaluations(
     return _halt_record_from_outcome(stage=halt_stage, outcome=halt_outcome)
 
 
-def _observer_allowed_invariants(observer: ObserverFrame | None) -> set[InvariantId] | None:
+def _observer_allowed_invariants(observer: ObserverFrame | None) -> frozenset[InvariantId] | None:
     if observer is None:
         return None
 
@@ -971,22 +977,19 @@ def _observer_allowed_invariants(observer: ObserverFrame | None) -> set[Invarian
     if not configured:
         return None
 
+    return _allowed_invariants_from_names(tuple(configured))
+
+
+@functools.lru_cache(maxsize=256)
+def _allowed_invariants_from_names(names: tuple[str, ...]) -> frozenset[InvariantId]:
+    # Keyed on the configured names (not the observer), so mutating the frame stays correct.
     allowed: set[InvariantId] = set()
-    for invariant_name in configured:
+    for invariant_name in names:
         try:
             allowed.add(InvariantId(invariant_name))
         except ValueError:
             continue
-    return allowed
-
-
-def _observer_allows_invariant(
-    *, observer: ObserverFrame | None, invariant_id: InvariantId
-) -> bool:
-    allowed = _observer_allowed_invariants(observer)
-    if allowed is None:
-        return True
-    return invariant_id in allowed
+    return frozenset(allowed)
 
 
 def _observer_has_capability(observer: ObserverFrame | None, capability: str) -> bool:
@@ -1003,24 +1006,33 @@ def _observer_authorized_for_action(
     required_capability: str,
 ) -> tuple[bool, dict[str, object]]:
     authorized = _observer_has_capability(observer, required_capability)
-    context = {
+    # ObserverFrame always defines these fields; only a missing frame needs the fallbacks.
+    context: dict[str, object] = {
         "action": action,
         "required_capability": required_capability,
-        "observer_role": getattr(observer, "role", None),
-        "authorization_level": getattr(observer, "authorization_level", None),
-        "observer_capabilities": list(getattr(observer, "capabilities", []) or []),
+        "observer_role": observer.role if observer is not None else None,
+        "authorization_level": observer.authorization_level if observer is not None else None,
+        "observer_capabilities": list(observer.capabilities) if observer is not None else [],
         "authorized": authorized,
     }
     return authorized, context
 
 
+def _evidence_basis(item: object) -> str:
+    # Same text as str(_to_dict(item)) for an EvidenceRef, without the model_dump round trip.
+    if type(item) is EvidenceRef:
+        return f"{{'kind': {item.kind!r}, 'ref': {item.ref!r}}}"
+    return str(_to_dict(item))
+
+
 def _stable_halt_id(*, stage: str, outcome: InvariantOutcome) -> str:
+    # The basis format is part of the persisted halt id; keep it byte-for-byte stable.
     basis = "|".join(
         [
             stage,
             outcome.invariant_id.value,
             outcome.reason,
-            ",".join(sorted(str(_to_dict(item)) for item in outcome.evidence)),
+            ",".join(sorted(_evidence_basis(item) for item in outcome.evidence)),
         ]
     )
     return f"halt:{sha1_text(basis)}"
@@ -1220,6 +1232,14 @@ def _capability_adapter_failure_decision(
     )
 
 
+# Gate phases in evaluation order: (phase, invariant, checks the just-written prediction).
+# The post-write phase only runs when a prediction was written in this pass.
+_GATE_PHASE_SPECS: tuple[tuple[str, InvariantId, bool], ...] = (
+    ("pre_consume", InvariantId.PREDICTION_AVAILABILITY, False),
+    ("post_write", InvariantId.EVIDENCE_LINK_COMPLETENESS, True),
+)
+
+
 def _evaluate_invariant_gate_pipeline(
     *,
     observer: ObserverFrame | None,
@@ -1231,21 +1251,13 @@ def _evaluate_invariant_gate_pipeline(
     gate_point: str,
 ) -> tuple[list[GateInvariantEvaluation], GateDecision]:
     evaluations: list[GateInvariantEvaluation] = []
-    gate_specs: tuple[tuple[str, InvariantId, bool, CanonicalPredictionPayload | None], ...] = (
-        ("pre_consume", InvariantId.PREDICTION_AVAILABILITY, True, None),
-        (
-            "post_write",
-            InvariantId.EVIDENCE_LINK_COMPLETENESS,
-            just_written_prediction is not None,
-            just_written_prediction,
-        ),
-    )
-
-    for phase, invariant_id, is_enabled, phase_written_prediction in gate_specs:
-        if not is_enabled or not _observer_allows_invariant(
-            observer=observer, invariant_id=invariant_id
-        ):
+    allowed = _observer_allowed_invariants(observer)
+    for phase, invariant_id, checks_written_prediction in _GATE_PHASE_SPECS:
+        if checks_written_prediction and just_written_prediction is None:
+            continue
+        if allowed is not None and invariant_id not in allowed:
             continue
+        phase_written_prediction = just_written_prediction if checks_written_prediction else None
         evaluation = _evaluate_gate_phase(
             scope=scope,
             prediction_key=prediction_key,
@@ -1278,7 +1290,7 @@ def _append_authorization_issue(
             "artifact_kind": "authorization_issue",
             "issue_type": "authorization_scope_violation",
             **_halt_payload(halt),
-            "observer": _to_dict(getattr(ep, "observer", None)),
+            "observer": _observer_payload(ep.observer),
             "authorization_context": _to_dict(context),
         },
     )
@@ -1328,8 +1340,35 @@ def append_turn_summary(ep: Episode) -> None:
     )
 
 
+# Holds the timestamp shared by one logical processing pass (see `_now_cache`).
+_NOW_ISO_CACHE: ContextVar[list[str] | None] = ContextVar("_NOW_ISO_CACHE", default=None)
+
+
 def _now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    cached = _NOW_ISO_CACHE.get()
+    if cached is None:
+        return datetime.now(UTC).isoformat()
+    if not cached:
+        cached.append(datetime.now(UTC).isoformat())
+    return cached[0]
+
+
+@contextmanager
+def _now_cache() -> Iterator[None]:
+    """
+    Pin `_now_iso()` to a single timestamp for one invariant-evaluation pass.
+
+    Nested passes reuse the outermost timestamp; usable as a decorator. Do not wrap code
+    that calls out to hooks or adapters: timestamps taken after them must stay fresh.
+    """
+    if _NOW_ISO_CACHE.get() is not None:
+        yield
+        return
+    token = _NOW_ISO_CACHE.set([])
+    try:
+        yield
+    finally:
+        _NOW_ISO_CACHE.reset(token)
 
 
 def _new_id(prefix: str = "") -> str:
@@ -1337,42 +1376,66 @@ def _new_id(prefix: str = "") -> str:
     return f"{prefix}{s}" if prefix else s
 
 
+_EMPTY_SHA1_TEXT = hashlib.sha1(b"", usedforsecurity=False).hexdigest()[:10]
+
+
 def sha1_text(s: str) -> str:
-    return hashlib.sha1((s or "").encode("utf-8")).hexdigest()[:10]
+    # Non-cryptographic id basis: keep SHA-1 so persisted halt/repair ids stay stable.
+    if not s:
+        return _EMPTY_SHA1_TEXT
+    return hashlib.sha1(s.encode("utf-8"), usedforsecurity=False).hexdigest()[:10]
 
 
 def is_exit_intent(txt_lower: str) -> bool:
     if txt_lower.strip() in EXIT_EXACT:
         return True
-    return any(p in txt_lower for p in EXIT_PHRASES)
+    return EXIT_PHRASES_RE.search(txt_lower) is not None
 
 
 def classify_utterance(sentence: str | None, error: CaptureOutcome | None) -> UtteranceType:
-    if error is not None and error.status == CaptureStatus.NO_RESPONSE:
+    # Enum members are singletons, so identity checks are enough on these per-tick paths.
+    if not sentence or (error is not None and error.status is CaptureStatus.NO_RESPONSE):
         return UtteranceType.NONE
-    txt = (sentence or "").strip().lower()
+    txt = sentence.strip().lower()
     if not txt:
         return UtteranceType.NONE
     if is_exit_intent(txt):
         return UtteranceType.EXIT_INTENT
-    if any(p in txt for p in PHATIC_PATTERNS) and len(txt.split()) <= 8:
+    # Word-count filter first: most utterances are long enough to skip the phatic scan.
+    if len(txt.split()) <= 8 and _PHATIC_PATTERNS_RE.search(txt) is not None:
         return UtteranceType.LOW_SIGNAL
     return UtteranceType.NORMAL
 
 
+_JSON_PRIMITIVE_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+
 def _to_dict(obj: object) -> Any:
     """
     Convert dataclasses / pydantic models / enums / nested containers into JSON-safe primitives.
     """
-    if obj is None:
-        return None
+    # Most inputs are already primitives or plain containers from earlier dumps; primitive
+    # leaves are passed through inline so only nested values pay for a recursive call.
+    obj_type = type(obj)
+    if obj_type in _JSON_PRIMITIVE_TYPES:
+        return obj
+    if obj_type is dict:
+        return {
+            str(k): v if type(v) in _JSON_PRIMITIVE_TYPES else _to_dict(v)
+            for k, v in obj.items()  # type: ignore[attr-defined]
+        }
+    if obj_type is list:
+        return [
+            v if type(v) in _JSON_PRIMITIVE_TYPES else _to_dict(v)
+            for v in obj  # type: ignore[attr-defined]
+        ]
 
     # Pydantic v2
     if isinstance(obj, BaseModel):
         # mode="json" ensures Enums become values, datetimes become iso strings if present, etc.
         return obj.model_dump(mode="json")
 
-    # Enums
+    # Enums (checked before subclassed containers/primitives, e.g. StrEnum)
     if isinstance(obj, Enum):
         return obj.value
 
@@ -1386,6 +1449,23 @@ def _to_dict(obj: object) -> Any:
     return obj
 
 
+def _observer_payload(observer: ObserverFrame | None) -> Any:
+    """
+    `_to_dict(observer)` for the observer frame stamped on most artifacts.
+
+    ObserverFrame is flat (strings and string lists), so a field-by-field copy matches
+    `model_dump(mode="json")` at a fraction of the cost.
+    """
+    if type(observer) is not ObserverFrame:
+        return _to_dict(observer)
+    return {
+        "role": observer.role,
+        "capabilities": list(observer.capabilities),
+        "authorization_level": observer.authorization_level,
+        "evaluation_invariants": list(observer.evaluation_invariants),
+    }
+
+
 def _to_mapping(obj: object) -> dict[str, Any]:
     normalized = _to_dict(obj)
     return dict(normalized) if isinstance(normalized, Mapping) else {}
@@ -1415,45 +1495,30 @@ def _find_stable_ids_from_payload(payload: Mapping[str, object]) -> dict[str, st
     if not isinstance(feature_uri, str) or not feature_uri.strip():
         return {}
 
-    feature_path = Path(feature_uri)
-    if not feature_path.exists():
+    try:
+        feature_stat = Path(feature_uri).stat()
+    except OSError:
         return {}
 
-    feature_text = feature_path.read_text(encoding="utf-8")
-    doc = _parse_feature_doc(feature_text)
-    if doc is None:
+    stable = _feature_stable_ids(feature_uri, feature_stat.st_mtime_ns, feature_stat.st_size)
+    if stable is None:
         return {}
 
-    stable = derive_stable_ids(doc, uri=feature_uri)
-
     scenario_name = payload.get("scenario_name") or payload.get("scenario")
     step_text = payload.get("step_text") or payload.get("step_name")
 
     scenario_id: str | None = None
     if isinstance(scenario_name, str) and scenario_name.strip():
-        for key, sid in stable.scenario_ids.items():
-            if key.split(":", 1)[-1].split("@", 1)[0] == scenario_name:
-                scenario_id = sid
-                break
+        scenario_id = stable.scenario_id_by_name.get(scenario_name)
     elif len(stable.scenario_ids) == 1:
         scenario_id = next(iter(stable.scenario_ids.values()))
 
     step_id: str | None = None
     if isinstance(step_text, str) and step_text.strip():
-        for key, sid in stable.step_ids.items():
-            key_scenario, step_part = key.split("::", 1)
-            key_step_text = step_part.split(":", 1)[-1].split("@", 1)[0]
-            if key_step_text != step_text:
-                continue
-            if scenario_id is None:
-                step_id = sid
-                break
-            scenario_key = next(
-                (k for k, v in stable.scenario_ids.items() if v == scenario_id), None
-            )
-            if scenario_key is not None and key_scenario == scenario_key:
-                step_id = sid
-                break
+        if scenario_id is None:
+            step_id = stable.step_id_by_text.get(step_text)
+        else:
+            step_id = stable.step_id_by_scenario_and_text.get((scenario_id, step_text))
     elif len(stable.step_ids) == 1:
         step_id = next(iter(stable.step_ids.values()))
 
@@ -1465,6 +1530,19 @@ def _find_stable_ids_from_payload(payload: Mapping[str, object]) -> dict[str, st
     return out
 
 
+@functools.lru_cache(maxsize=256)
+def _feature_stable_ids(feature_uri: str, mtime_ns: int, size: int) -> StableIds | None:
+    """
+    Parse a feature file once per (path, mtime, size) and derive its stable IDs.
+
+    The stat fields are part of the cache key so edited feature files are re-parsed.
+    """
+    doc = _parse_feature_doc(Path(feature_uri).read_text(encoding="utf-8"))
+    if doc is None:
+        return None
+    return derive_stable_ids(doc, uri=feature_uri)
+
+
 def _parse_feature_doc(feature_text: str) -> GherkinDocument | None:
     """
     Parse Gherkin content if optional parser dependencies are installed.
@@ -1485,6 +1563,8 @@ def _parse_feature_doc(feature_text: str) -> GherkinDocument | None:
 
 
 def _episode_stable_ids(ep: Episode) -> dict[str, str]:
+    # Not memoized: artifacts are plain dicts that callers may edit or replace in place.
+    # Callers that already know the ids pass them as `stable_ids=` instead of rescanning.
     for artifact in ep.artifacts:
         if not isinstance(artifact, dict):
             continue
@@ -1504,18 +1584,34 @@ def _episode_stable_ids(ep: Episode) -> dict[str, str]:
 def _append_episode_artifact(
     ep: Episode, artifact: Mapping[str, object], *, stable_ids: Mapping[str, str] | None = None
 ) -> None:
-    sid = dict(stable_ids or _episode_stable_ids(ep))
-    materialized_artifact = dict(artifact)
-    ep.artifacts.append({**sid, **materialized_artifact} if sid else materialized_artifact)
+    # One merged dict per row: stable ids first, artifact fields override.
+    # An explicit (even empty) `stable_ids` is authoritative and skips the episode lookup.
+    if stable_ids is None:
+        stable_ids = _episode_stable_ids(ep)
+    row: dict[str, object] = {**stable_ids, **artifact}
+    ep.artifacts.append(row)
 
 
 def _run_invariant(invariant_id: InvariantId, *, ctx: CheckContext) -> InvariantOutcome:
+    return _run_invariant_with_halt_validation(invariant_id, ctx=ctx)[0]
+
+
+def _run_invariant_with_halt_validation(
+    invariant_id: InvariantId, *, ctx: CheckContext
+) -> tuple[InvariantOutcome, InvariantOutcome | None]:
+    """
+    Run one invariant and, for stop outcomes, the explainable-halt check on it.
+
+    The second element is the explainable-halt result for the returned outcome
+    when one was computed, so callers can report it without re-running the check.
+    """
     checker = REGISTRY[invariant_id]
     outcome = checker(ctx)
     if outcome.flow != InvariantFlow.STOP:
-        return outcome
+        return outcome, None
 
     h0_ctx = default_check_context(
+        now_iso=_now_iso(),
         scope=ctx.scope,
         prediction_key=ctx.prediction_key,
         current_predictions=ctx.current_predictions,
@@ -1525,8 +1621,8 @@ def _run_invariant(invariant_id: InvariantId, *, ctx: CheckContext) -> Invariant
     )
     explainable_halt = REGISTRY[InvariantId.EXPLAINABLE_HALT_PAYLOAD](h0_ctx)
     if explainable_halt.flow == InvariantFlow.STOP:
-        return explainable_halt
-    return outcome
+        return explainable_halt, None
+    return outcome, explainable_halt
 
 
 def _invariant_audit_result_from_checker(
@@ -1601,7 +1697,7 @@ def _apply_intervention_hook(
     outbox_request_id: str | None = None
     if ask_outbox_adapter is not None:
         policy_decision = _capability_invocation_policy_decision(
-            observer=getattr(ep, "observer", None),
+            observer=ep.observer,
             projection_state=projection_state,
             scope_key=f"{ep.conversation_id}:{ep.turn_index}:{phase}",
             prediction_key=None,
@@ -1761,24 +1857,41 @@ def evaluate_invariant_gates(
     gate_point: str = "pre-decision",
     just_written_prediction: CanonicalPredictionPayload | None = None,
     halt_log_path: str | Path = "halts.jsonl",
+    emit_artifacts: bool = True,
 ) -> GateDecision:
-    phase = _evaluate_gate_invariant_phase(
-        ep=ep,
-        scope=scope,
-        prediction_key=prediction_key,
-        projection_state=projection_state,
-        prediction_log_available=prediction_log_available,
-        gate_point=gate_point,
-        just_written_prediction=just_written_prediction,
-    )
-    selection = _select_gate_outcome_phase(
-        gate_point=gate_point,
-        scope=scope,
-        prediction_key=prediction_key,
-        prediction_log_available=prediction_log_available,
-        just_written_prediction=just_written_prediction,
-        phase=phase,
-    )
+    """
+    Evaluate the invariant gate pipeline for one gate point.
+
+    With `emit_artifacts=False` nothing is written: the halt is not appended to
+    `halt_log_path` and no episode artifacts/observations are built, which suits
+    read-only gate checks such as previews and dry runs.
+    """
+    # Checker evaluation makes no hook/adapter calls, so it shares one timestamp;
+    # persisting the halt and the episode artifacts happens outside the pin.
+    with _now_cache():
+        phase = _evaluate_gate_invariant_phase(
+            ep=ep,
+            scope=scope,
+            prediction_key=prediction_key,
+            projection_state=projection_state,
+            prediction_log_available=prediction_log_available,
+            gate_point=gate_point,
+            just_written_prediction=just_written_prediction,
+        )
+        selection = (
+            _select_gate_outcome_phase(
+                gate_point=gate_point,
+                scope=scope,
+                prediction_key=prediction_key,
+                prediction_log_available=prediction_log_available,
+                just_written_prediction=just_written_prediction,
+                phase=phase,
+            )
+            if ep is not None and emit_artifacts
+            else None
+        )
+    if not emit_artifacts:
+        return phase.result
     _emit_gate_artifacts_phase(
         ep=ep,
         scope=scope,
@@ -1803,7 +1916,7 @@ def _evaluate_gate_invariant_phase(
     gate_point: str,
     just_written_prediction: CanonicalPredictionPayload | None,
 ) -> GateEvaluationPhaseResult:
-    observer = getattr(ep, "observer", None) if ep is not None else None
+    observer = ep.observer if ep is not None else None
     is_authorized, auth_context = _observer_authorized_for_action(
         observer=observer,
         action="evaluate_invariant_gates",
@@ -1814,9 +1927,10 @@ def _evaluate_gate_invariant_phase(
     }
     authorization_evaluation: GateInvariantEvaluation | None = None
     if ep is not None:
-        auth_outcome = _run_invariant(
+        auth_outcome, auth_halt_validation = _run_invariant_with_halt_validation(
             InvariantId.AUTHORIZATION_SCOPE,
             ctx=default_check_context(
+                now_iso=_now_iso(),
                 scope=scope,
                 prediction_key=prediction_key,
                 current_predictions=current_predictions,
@@ -1829,6 +1943,7 @@ def _evaluate_gate_invariant_phase(
         authorization_evaluation = GateInvariantEvaluation(
             phase="authorization",
             outcome=auth_outcome,
+            halt_validation=auth_halt_validation,
         )
         if auth_outcome.flow == InvariantFlow.STOP:
             evaluations = [authorization_evaluation]
@@ -1873,8 +1988,6 @@ def _select_gate_outcome_phase(
     just_written_prediction: CanonicalPredictionPayload | None,
     phase: GateEvaluationPhaseResult,
 ) -> GateOutcomeSelectionResult:
-    gate_checks: list[GateInvariantCheck] = []
-    invariant_audit: list[InvariantAuditResult] = []
     result = phase.result
     evaluations = phase.evaluations
     outcome_bundle = (
@@ -1885,26 +1998,31 @@ def _select_gate_outcome_phase(
             post_write=tuple(ev.outcome for ev in evaluations if ev.phase == "post_write"),
         )
     )
-    for evaluation in evaluations:
-        normalized = normalize_outcome(evaluation.outcome, gate=gate_point)
-        gate_checks.append(
-            GateInvariantCheck(
-                gate_point=f"{gate_point}:{evaluation.phase}",
-                output=normalized,
-            )
-        )
-        invariant_audit.append(
-            _invariant_audit_result_from_checker(
-                f"{gate_point}:{evaluation.phase}",
-                normalized,
-            )
+    normalized_checks = [
+        (f"{gate_point}:{evaluation.phase}", normalized)
+        for evaluation, normalized in zip(
+            evaluations,
+            normalize_outcomes([evaluation.outcome for evaluation in evaluations], gate=gate_point),
+            strict=True,
         )
+    ]
+    gate_checks = [
+        GateInvariantCheck(gate_point=check_point, output=normalized)
+        for check_point, normalized in normalized_checks
+    ]
+    invariant_audit = [
+        _invariant_audit_result_from_checker(check_point, normalized)
+        for check_point, normalized in normalized_checks
+    ]
 
     halt_outcome, _ = _first_halt_from_evaluations(evaluations=evaluations, gate_point=gate_point)
     if isinstance(result, HaltRecord) and halt_outcome is not None:
-        halt_validation = normalize_outcome(
-            REGISTRY[InvariantId.EXPLAINABLE_HALT_PAYLOAD](
+        halt_evaluation = next(ev for ev in evaluations if ev.outcome is halt_outcome)
+        halt_check = halt_evaluation.halt_validation
+        if halt_check is None:
+            halt_check = REGISTRY[InvariantId.EXPLAINABLE_HALT_PAYLOAD](
                 default_check_context(
+                    now_iso=_now_iso(),
                     scope=scope,
                     prediction_key=prediction_key,
                     current_predictions=phase.current_predictions,
@@ -1912,9 +2030,8 @@ def _select_gate_outcome_phase(
                     just_written_prediction=just_written_prediction,
                     halt_candidate=halt_outcome,
                 )
-            ),
-            gate=gate_point,
-        )
+            )
+        halt_validation = normalize_outcome(halt_check, gate=gate_point)
         gate_checks.append(
             GateInvariantCheck(
                 gate_point="halt_validation",
@@ -1944,7 +2061,7 @@ def _emit_gate_artifacts_phase(
     just_written_prediction: CanonicalPredictionPayload | None,
     halt_log_path: str | Path,
     phase: GateEvaluationPhaseResult,
-    selection: GateOutcomeSelectionResult,
+    selection: GateOutcomeSelectionResult | None,
 ) -> None:
     result = phase.result
     halt_evidence_ref: dict[str, str] | None = None
@@ -1955,26 +2072,29 @@ def _emit_gate_artifacts_phase(
             halt_log_path=halt_log_path,
             stable_ids=stable_ids,
         )
-        if phase.authorization_evaluation is not None:
+        if phase.authorization_evaluation is not None and selection is not None:
             halt_outcome = phase.authorization_evaluation.outcome
             if ep is not None and halt_outcome.invariant_id == InvariantId.AUTHORIZATION_SCOPE:
                 _append_authorization_issue(ep, halt=result, context=phase.auth_context)
 
-    if ep is None:
+    if ep is None or selection is None:
         return
 
+    # `combined` is pre_consume + post_write; dump each outcome once and reuse it.
+    pre_consume = [_to_dict(outcome) for outcome in selection.outcome_bundle.pre_consume]
+    post_write = [_to_dict(outcome) for outcome in selection.outcome_bundle.post_write]
+    observer = phase.observer
+    requested_invariants = list(getattr(observer, "evaluation_invariants", None) or [])
     _append_episode_artifact(
         ep,
         {
             "artifact_kind": "invariant_outcomes",
-            "observer": _to_dict(getattr(ep, "observer", None)),
+            "observer": _observer_payload(ep.observer),
             "observer_enforcement": {
-                "requested_evaluation_invariants": list(
-                    getattr(phase.observer, "evaluation_invariants", []) or []
-                ),
-                "enforced": bool(getattr(phase.observer, "evaluation_invariants", []) or []),
-                "observer_role": getattr(phase.observer, "role", None),
-                "authorization_level": getattr(phase.observer, "authorization_level", None),
+                "requested_evaluation_invariants": requested_invariants,
+                "enforced": bool(requested_invariants),
+                "observer_role": getattr(observer, "role", None),
+                "authorization_level": getattr(observer, "authorization_level", None),
             },
             "scope": scope,
             "prediction_key": prediction_key,
@@ -1982,13 +2102,15 @@ def _emit_gate_artifacts_phase(
                 "has_current_predictions": projection_state.has_current_predictions,
                 "current_predictions": dict(phase.current_predictions),
                 "prediction_log_available": prediction_log_available,
-                "just_written_prediction": _to_dict(just_written_prediction),
+                "just_written_prediction": (
+                    _to_dict(just_written_prediction)
+                    if just_written_prediction is not None
+                    else None
+                ),
             },
-            "pre_consume": [_to_dict(outcome) for outcome in selection.outcome_bundle.pre_consume],
-            "post_write": [_to_dict(outcome) for outcome in selection.outcome_bundle.post_write],
-            "invariant_results": [
-                _to_dict(outcome) for outcome in selection.outcome_bundle.combined
-            ],
+            "pre_consume": pre_consume,
+            "post_write": post_write,
+            "invariant_results": [*pre_consume, *post_write],
             "invariant_checks": [
                 {
                     "gate_point": check.gate_point,
@@ -2107,7 +2229,7 @@ def _prediction_append_policy_handoff(
             update={"current_predictions": {pred.scope_key: pred}}
         )
     policy_decision = _capability_invocation_policy_decision(
-        observer=getattr(episode, "observer", None),
+        observer=episode.observer if episode is not None else None,
         projection_state=state_for_policy,
         scope_key=pred.scope_key,
         prediction_key=pred.prediction_key,
@@ -2231,10 +2353,8 @@ def _append_repair_event(
     payload: dict[str, object] = event.model_dump(mode="json")
     if stable_ids:
         payload = {**dict(stable_ids), **payload}
-    append_jsonl(prediction_log_path, payload)
-    p = Path(prediction_log_path)
-    line_count = len(p.read_text(encoding="utf-8").splitlines())
-    return {"kind": "jsonl", "ref": f"{p.name}@{line_count}"}
+    offset = append_jsonl(prediction_log_path, payload)
+    return {"kind": "jsonl", "ref": f"{Path(prediction_log_path).name}@{offset}"}
 
 
 def _apply_accepted_repair_event(
@@ -2269,7 +2389,8 @@ def _project_current_at(
     current = dict(projection_state.current_predictions)
     current[pred.scope_key] = pred
     history = [*projection_state.prediction_history, pred]
-    return ProjectionState(
+    # Every field is an already-validated model or a fresh copy of one; skip revalidation.
+    return ProjectionState.model_construct(
         current_predictions=current,
         prediction_history=history,
         active_missions=dict(projection_state.active_missions),
@@ -2736,7 +2857,8 @@ def _reconcile_predictions(
     error_total = 0.0
     stable_ids = _episode_stable_ids(ep)
 
-    for scope_key, pred in list(projection_state.current_predictions.items()):
+    # Projections are copy-on-write (see _project_current_at), so the input mapping is stable.
+    for scope_key, pred in projection_state.current_predictions.items():
         if pred.target_variable != "user_response_present" or pred.expectation is None:
             continue
 
@@ -2778,14 +2900,25 @@ def _reconcile_predictions(
         )
         metrics["mae"] = metrics["absolute_error_total"] / metrics["comparisons"]
 
-    return ProjectionState(
+    last_comparison_at_iso = _now_iso() if compared else projection_state.last_comparison_at_iso
+    if updated_projection is not projection_state:
+        # Built during this call and not shared with the caller: reuse its containers
+        # instead of copying the full history once more.
+        return updated_projection.model_copy(
+            update={
+                "correction_metrics": metrics,
+                "last_comparison_at_iso": last_comparison_at_iso,
+                "updated_at_iso": _now_iso(),
+            }
+        )
+    return ProjectionState.model_construct(
         current_predictions=dict(updated_projection.current_predictions),
         prediction_history=list(updated_projection.prediction_history),
         active_missions=dict(updated_projection.active_missions),
         deferred_missions=dict(updated_projection.deferred_missions),
         completed_missions=dict(updated_projection.completed_missions),
         correction_metrics=metrics,
-        last_comparison_at_iso=_now_iso() if compared else projection_state.last_comparison_at_iso,
+        last_comparison_at_iso=last_comparison_at_iso,
         updated_at_iso=_now_iso(),
     )
 
@@ -2902,6 +3035,7 @@ def _emit_prediction_comparison_artifact(
     invariant_handling_mode: InvariantHandlingMode,
 ) -> None:
     binding_ctx = default_check_context(
+        now_iso=_now_iso(),
         scope=scope_key,
         prediction_key=scope_key,
         current_predictions={
@@ -3343,7 +3477,7 @@ def ingest_observation(ep: Episode) -> Episode:
 
 def extract_user_utterance(ep: Episode) -> str | None:
     for o in ep.observations:
-        if o.type == ObservationType.USER_UTTERANCE:
+        if o.type is ObservationType.USER_UTTERANCE:
             return (o.text or "").strip() or None
     return None
 
@@ -3352,12 +3486,16 @@ def attach_decision_effect(prev_ep: Episode | None, curr_ep: Episode) -> Episode
     if not prev_ep:
         return curr_ep
 
-    decision_id = getattr(prev_ep.policy_decision, "decision_id", None)
+    policy_decision = prev_ep.policy_decision
+    if policy_decision is None:
+        return curr_ep
+    decision_id = policy_decision.decision_id
     if not decision_id:
         return curr_ep
 
+    observer = curr_ep.observer
     is_authorized, auth_context = _observer_authorized_for_action(
-        observer=curr_ep.observer,
+        observer=observer,
         action="attach_decision_effect",
         required_capability="baseline.evaluation",
     )
@@ -3374,7 +3512,7 @@ def attach_decision_effect(prev_ep: Episode | None, curr_ep: Episode) -> Episode
     had_user = bool(user_text)
     user_chars = len(user_text) if user_text else 0
 
-    hyp = getattr(prev_ep.policy_decision, "hypothesis", None)
+    hyp = policy_decision.hypothesis
     held = bool(curr_ep.ask.status == AskStatus.OK and had_user)
 
     eff = DecisionEffect(
@@ -3389,9 +3527,9 @@ def attach_decision_effect(prev_ep: Episode | None, curr_ep: Episode) -> Episode
         notes={
             "hypothesis": hyp,
             "held": held,
-            "observer": _to_dict(curr_ep.observer),
-            "observer_role": getattr(curr_ep.observer, "role", None),
-            "authorization_level": getattr(curr_ep.observer, "authorization_level", None),
+            "observer": _observer_payload(observer),
+            "observer_role": getattr(observer, "role", None),
+            "authorization_level": getattr(observer, "authorization_level", None),
         },
         hypothesis_eval=HypothesisEvaluation(hypothesis=hyp, held=held),
     )
@@ -3449,9 +3587,24 @@ def apply_schema_bubbling(
         schema_selector=schema_selector,
     )
 
-    # --- Schemas
-    belief.active_schemas = [h.name for h in sel.schemas]
-    belief.schema_confidence = {h.name: float(h.score) for h in sel.schemas}
+    # --- Schemas (one pass feeds belief state and the schema_selection artifact)
+    active_schemas: list[str] = []
+    schema_confidence: dict[str, float] = {}
+    schema_artifacts: list[dict[str, Any]] = []
+    for h in sel.schemas:
+        active_schemas.append(h.name)
+        schema_confidence[h.name] = float(h.score)
+        schema_artifacts.append(
+            {
+                "name": h.name,
+                "score": h.score,
+                "about": _to_dict(h.about),
+                "schema_id": h.schema_id,
+                "source": h.source,
+            }
+        )
+    belief.active_schemas = active_schemas
+    belief.schema_confidence = schema_confidence
 
     # --- Ambiguities
     belief.ambiguities_active = list(sel.ambiguities or [])
@@ -3532,17 +3685,8 @@ def apply_schema_bubbling(
         ep,
         {
             "kind": "schema_selection",
-            "observer": _to_dict(getattr(ep, "observer", None)),
-            "schemas": [
-                {
-                    "name": h.name,
-                    "score": h.score,
-                    "about": _to_dict(h.about),
-                    "schema_id": h.schema_id,
-                    "source": h.source,
-                }
-                for h in sel.schemas
-            ],
+            "observer": _observer_payload(ep.observer),
+            "schemas": schema_artifacts,
             "ambiguities": [_to_dict(a) for a in belief.ambiguities_active],
             "intent_outputs": [_to_dict(o) for o in sel.intent_outputs],
             "ambiguity_state": belief.ambiguity_state.value,
@@ -3564,8 +3708,9 @@ def apply_schema_bubbling(
 
 
 def apply_utterance_interpretation(ep: Episode, belief: BeliefState) -> tuple[Episode, BeliefState]:
+    observer = ep.observer
     is_authorized, auth_context = _observer_authorized_for_action(
-        observer=ep.observer,
+        observer=observer,
         action="apply_utterance_interpretation",
         required_capability="baseline.dialog",
     )
@@ -3578,14 +3723,15 @@ def apply_utterance_interpretation(ep: Episode, belief: BeliefState) -> tuple[Ep
         _append_authorization_issue(ep, halt=halt, context=auth_context)
         return ep, belief
 
+    ask = ep.ask
     user_text = extract_user_utterance(ep)
-    utype = classify_utterance(user_text, ep.ask.error)
+    utype = classify_utterance(user_text, ask.error)
 
     belief.last_utterance_type = utype
-    belief.last_status = ep.ask.status
+    belief.last_status = ask.status
 
     # Update consecutive no-response streak
-    if ep.ask.status == AskStatus.NO_RESPONSE:
+    if ask.status is AskStatus.NO_RESPONSE:
         belief.consecutive_no_response += 1
     else:
         belief.consecutive_no_response = 0
@@ -3594,10 +3740,12 @@ def apply_utterance_interpretation(ep: Episode, belief: BeliefState) -> tuple[Ep
         ep,
         {
             "kind": "utterance_interpretation",
-            "observer": _to_dict(getattr(ep, "observer", None)),
+            "observer": _observer_payload(observer),
             "interpretation_frame": {
-                "observer_role": getattr(ep.observer, "role", None),
-                "authorization_level": getattr(ep.observer, "authorization_level", None),
+                "observer_role": observer.role if observer is not None else None,
+                "authorization_level": (
+                    observer.authorization_level if observer is not None else None
+                ),
             },
             "utterance_type": utype.value,
             "text_preview": (user_text[:80] if isinstance(user_text, str) else None),
@@ -12,13 +12,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GherkinLocation:
     line: int | None
     column: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GherkinStep:
     text: str
     keyword_type: str
@@ -26,7 +26,7 @@ class GherkinStep:
     location: GherkinLocation
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GherkinScenario:
     name: str
     keyword: str
@@ -34,14 +34,14 @@ class GherkinScenario:
     steps: tuple[GherkinStep, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GherkinFeature:
     name: str
     location: GherkinLocation
     scenarios: tuple[GherkinScenario, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GherkinDocument:
     uri: str
     feature: GherkinFeature
@@ -57,51 +57,43 @@ class GherkinDocument:
 
         feature_location = _location_from_raw(feature_raw.get("location"))
 
-        scenarios: list[GherkinScenario] = []
         children = feature_raw.get("children")
+        scenarios: tuple[GherkinScenario, ...] = ()
         if isinstance(children, list):
-            for child in children:
-                if not isinstance(child, dict):
-                    continue
-                scenario_raw = child.get("scenario")
-                scenario = _scenario_from_raw(scenario_raw)
-                if scenario is not None:
-                    scenarios.append(scenario)
+            scenarios = tuple(
+                _scenario_from_raw(scenario_raw)
+                for child in children
+                if isinstance(child, dict)
+                and isinstance(scenario_raw := child.get("scenario"), dict)
+            )
 
         feature = GherkinFeature(
             name=_as_str(feature_raw.get("name")),
             location=feature_location,
-            scenarios=tuple(scenarios),
+            scenarios=scenarios,
         )
 
         raw_uri = _as_str(raw.get("uri"))
         return cls(uri=uri or raw_uri, feature=feature)
 
 
-def _scenario_from_raw(raw: object) -> GherkinScenario | None:
-    if not isinstance(raw, dict):
-        return None
-
-    steps: list[GherkinStep] = []
+def _scenario_from_raw(raw: dict[str, object]) -> GherkinScenario:
     steps_raw = raw.get("steps")
+    steps: tuple[GherkinStep, ...] = ()
     if isinstance(steps_raw, list):
-        for step_raw in steps_raw:
-            step = _step_from_raw(step_raw)
-            if step is not None:
-                steps.append(step)
+        steps = tuple(
+            _step_from_raw(step_raw) for step_raw in steps_raw if isinstance(step_raw, dict)
+        )
 
     return GherkinScenario(
         name=_as_str(raw.get("name")),
         keyword=_as_str(raw.get("keyword")),
         location=_location_from_raw(raw.get("location")),
-        steps=tuple(steps),
+        steps=steps,
     )
 
 
-def _step_from_raw(raw: object) -> GherkinStep | None:
-    if not isinstance(raw, dict):
-        return None
-
+def _step_from_raw(raw: dict[str, object]) -> GherkinStep:
     return GherkinStep(
         text=_as_str(raw.get("text")),
         keyword_type=_as_str(raw.get("keywordType")),
@@ -3,11 +3,15 @@ from __future__ import annotations
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Protocol
 
 from state_renormalization._compat import UTC, StrEnum
 from state_renormalization.contracts import EvidenceRef
 
+# Shared read-only stand-in for absent optional mappings on the checker paths.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
 class InvariantId(StrEnum):
     AUTHORIZATION_SCOPE = "authorization.scope.v1"
@@ -33,7 +37,26 @@ class Validity(StrEnum):
     INVALID = "invalid"
 
 
-@dataclass(frozen=True)
+# Member aliases for the checker bodies: on Python < 3.12 `Flow.STOP` is a metaclass
+# attribute lookup, roughly 10x a module global read.
+_STOP = Flow.STOP
+_CONTINUE = Flow.CONTINUE
+_VALID = Validity.VALID
+_INVALID = Validity.INVALID
+_DEGRADED = Validity.DEGRADED
+
+# `.value` on an enum member goes through a descriptor; normalization runs per outcome per
+# gate, so the string values are read from this table instead.
+_ENUM_VALUES: dict[InvariantId | Flow | Validity, str] = {
+    member: member.value for enum_type in (InvariantId, Flow, Validity) for member in enum_type
+}
+
+
+# `slots=True` drops the per-instance __dict__. CheckerResult keeps its __dict__ because
+# callers serialize it via `.__dict__`.
+
+
+@dataclass(frozen=True, slots=True)
 class InvariantOutcome:
     invariant_id: InvariantId
     passed: bool
@@ -41,9 +64,9 @@ class InvariantOutcome:
     flow: Flow
     validity: Validity
     code: str
-    evidence: Sequence[EvidenceRef] = field(default_factory=tuple)
+    evidence: tuple[EvidenceRef, ...] = ()
     details: Mapping[str, Any] = field(default_factory=dict)
-    action_hints: Sequence[Mapping[str, Any]] | None = None
+    action_hints: tuple[Mapping[str, Any], ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -55,12 +78,12 @@ class CheckerResult:
     flow: str
     validity: str
     code: str
-    evidence: Sequence[EvidenceRef] = field(default_factory=tuple)
+    evidence: Sequence[EvidenceRef] = ()
     details: Mapping[str, Any] = field(default_factory=dict)
-    action_hints: Sequence[Mapping[str, Any]] = field(default_factory=tuple)
+    action_hints: Sequence[Mapping[str, Any]] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvariantBranchBehavior:
     continue_behavior: str
     stop_behavior: str | None = None
@@ -98,7 +121,7 @@ class CheckContext(Protocol):
     def authorization_context(self) -> Mapping[str, Any] | None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvariantCheckContext:
     now_iso: str
     scope: str
@@ -120,24 +143,26 @@ def check_authorization_scope(ctx: CheckContext) -> InvariantOutcome:
             {"message": "Authorization scope check not requested for this gate evaluation."},
         )
 
-    action = str((ctx.authorization_context or {}).get("action") or "unknown")
-    capability = str((ctx.authorization_context or {}).get("required_capability") or "unknown")
+    authorization_context = ctx.authorization_context or _EMPTY_MAPPING
     if ctx.authorization_allowed:
         return _ok(
             InvariantId.AUTHORIZATION_SCOPE,
             "authorization_scope_allowed",
             {
                 "message": "Observer is authorized for invariant gate evaluation.",
-                "authorization_context": _normalize_mapping(ctx.authorization_context),
+                "authorization_context": _normalize_mapping(authorization_context),
             },
         )
 
+    action = str(authorization_context.get("action") or "unknown")
+    capability = str(authorization_context.get("required_capability") or "unknown")
+
     return InvariantOutcome(
         invariant_id=InvariantId.AUTHORIZATION_SCOPE,
         passed=False,
         reason="observer is not authorized to evaluate invariant gates",
-        flow=Flow.STOP,
-        validity=Validity.INVALID,
+        flow=_STOP,
+        validity=_INVALID,
         code="authorization_scope_denied",
         evidence=(
             EvidenceRef(kind="authorization_scope", ref=f"action:{action}"),
@@ -145,7 +170,7 @@ def check_authorization_scope(ctx: CheckContext) -> InvariantOutcome:
         ),
         details={
             "message": "Observer is not authorized for invariant gate evaluation.",
-            "authorization_context": _normalize_mapping(ctx.authorization_context),
+            "authorization_context": _normalize_mapping(authorization_context),
         },
         action_hints=({"kind": "review_authorization", "scope": ctx.scope},),
     )
@@ -157,27 +182,31 @@ Checker = Callable[[CheckContext], InvariantOutcome]
 def _ok(
     invariant_id: InvariantId, code: str, details: Mapping[str, Any] | None = None
 ) -> InvariantOutcome:
-    detail_map = dict(details or {})
+    detail_map = dict(details) if details else {}
     reason = str(detail_map.get("message") or code)
     return InvariantOutcome(
         invariant_id=invariant_id,
         passed=True,
         reason=reason,
-        flow=Flow.CONTINUE,
-        validity=Validity.VALID,
+        flow=_CONTINUE,
+        validity=_VALID,
         code=code,
         details=detail_map,
     )
 
 
+_NUMERIC_TYPES: frozenset[type] = frozenset({int, float})
+
+
 def check_prediction_availability(ctx: CheckContext) -> InvariantOutcome:
-    if not ctx.current_predictions:
+    current_predictions = ctx.current_predictions
+    if not current_predictions:
         return InvariantOutcome(
             invariant_id=InvariantId.PREDICTION_AVAILABILITY,
             passed=False,
             reason="Action selection requires at least one projected current prediction.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="no_predictions_projected",
             evidence=(EvidenceRef(kind="scope", ref=ctx.scope),),
             details={
@@ -190,13 +219,13 @@ def check_prediction_availability(ctx: CheckContext) -> InvariantOutcome:
     if not key:
         return _ok(InvariantId.PREDICTION_AVAILABILITY, "availability_not_keyed")
 
-    if key not in ctx.current_predictions:
+    if key not in current_predictions:
         return InvariantOutcome(
             invariant_id=InvariantId.PREDICTION_AVAILABILITY,
             passed=False,
             reason="Action selection attempted to consume a missing current prediction.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="no_current_prediction",
             evidence=(
                 EvidenceRef(kind="scope", ref=ctx.scope),
@@ -209,7 +238,9 @@ def check_prediction_availability(ctx: CheckContext) -> InvariantOutcome:
         )
 
     return _ok(
-        InvariantId.PREDICTION_AVAILABILITY, "current_prediction_available", {"prediction_key": key}
+        InvariantId.PREDICTION_AVAILABILITY,
+        "current_prediction_available",
+        {"prediction_key": key},
     )
 
 
@@ -217,14 +248,15 @@ def check_evidence_link_completeness(ctx: CheckContext) -> InvariantOutcome:
     written = ctx.just_written_prediction
     if written is None:
         return _ok(InvariantId.EVIDENCE_LINK_COMPLETENESS, "evidence_check_not_applicable")
+    scope = ctx.scope
 
     if not ctx.prediction_log_available:
         return InvariantOutcome(
             invariant_id=InvariantId.EVIDENCE_LINK_COMPLETENESS,
             passed=False,
             reason="Prediction write attempted without an available append log.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="prediction_log_unavailable",
             details={"message": "Prediction write attempted without an available append log."},
             action_hints=({"kind": "fallback", "action": "buffer_prediction"},),
@@ -236,12 +268,12 @@ def check_evidence_link_completeness(ctx: CheckContext) -> InvariantOutcome:
             invariant_id=InvariantId.EVIDENCE_LINK_COMPLETENESS,
             passed=False,
             reason="Prediction append did not produce linked evidence.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="missing_evidence_links",
-            evidence=(EvidenceRef(kind="scope", ref=ctx.scope),),
+            evidence=(EvidenceRef(kind="scope", ref=scope),),
             details={"message": "Prediction append did not produce linked evidence."},
-            action_hints=({"kind": "retry_append", "scope": ctx.scope},),
+            action_hints=({"kind": "retry_append", "scope": scope},),
         )
 
     key = str(written.get("key") or ctx.prediction_key or "")
@@ -250,12 +282,12 @@ def check_evidence_link_completeness(ctx: CheckContext) -> InvariantOutcome:
             invariant_id=InvariantId.EVIDENCE_LINK_COMPLETENESS,
             passed=False,
             reason="Prediction write did not materialize into current projections.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="write_before_use_violation",
             evidence=(EvidenceRef(kind="prediction_key", ref=key),),
             details={"message": "Prediction write did not materialize into current projections."},
-            action_hints=({"kind": "rebuild_view", "scope": ctx.scope},),
+            action_hints=({"kind": "rebuild_view", "scope": scope},),
         )
 
     return _ok(
@@ -276,21 +308,25 @@ def check_prediction_outcome_binding(ctx: CheckContext) -> InvariantOutcome:
             invariant_id=InvariantId.PREDICTION_OUTCOME_BINDING,
             passed=False,
             reason="Prediction outcome must include prediction_id.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="missing_prediction_id",
             details={"message": "Prediction outcome must include prediction_id."},
             action_hints=({"kind": "repair_outcome", "scope": ctx.scope},),
         )
 
     error_metric = outcome.get("error_metric")
-    if not isinstance(error_metric, (int, float)):
+    # Exact-type probe for the usual float/int; isinstance keeps accepting subclasses
+    # other than bool, which is not a metric even though it subclasses int.
+    if type(error_metric) not in _NUMERIC_TYPES and (
+        isinstance(error_metric, bool) or not isinstance(error_metric, (int, float))
+    ):
         return InvariantOutcome(
             invariant_id=InvariantId.PREDICTION_OUTCOME_BINDING,
             passed=False,
             reason="Prediction outcome must include numeric error_metric.",
-            flow=Flow.STOP,
-            validity=Validity.INVALID,
+            flow=_STOP,
+            validity=_INVALID,
             code="non_numeric_error_metric",
             evidence=(EvidenceRef(kind="prediction_id", ref=prediction_id),),
             details={"message": "Prediction outcome must include numeric error_metric."},
@@ -306,10 +342,11 @@ def check_prediction_outcome_binding(ctx: CheckContext) -> InvariantOutcome:
 
 def check_explainable_halt_payload(ctx: CheckContext) -> InvariantOutcome:
     candidate = ctx.halt_candidate
-    if candidate is None or candidate.flow != Flow.STOP:
+    if candidate is None or candidate.flow != _STOP:
         return _ok(InvariantId.EXPLAINABLE_HALT_PAYLOAD, "halt_check_not_applicable")
 
-    has_invariant_id = bool(candidate.invariant_id.value)
+    # InvariantId is a str enum, so its truthiness is that of its value.
+    has_invariant_id = bool(candidate.invariant_id)
     has_details_field = candidate.details is not None
     has_evidence_field = candidate.evidence is not None
     if has_invariant_id and has_details_field and has_evidence_field:
@@ -319,8 +356,8 @@ def check_explainable_halt_payload(ctx: CheckContext) -> InvariantOutcome:
         invariant_id=InvariantId.EXPLAINABLE_HALT_PAYLOAD,
         passed=False,
         reason="Stop outcomes must include invariant_id, details, and evidence fields.",
-        flow=Flow.STOP,
-        validity=Validity.DEGRADED,
+        flow=_STOP,
+        validity=_DEGRADED,
         code="halt_payload_incomplete",
         details={
             "message": "Stop outcomes must include invariant_id, details, and evidence fields.",
@@ -345,7 +382,13 @@ REGISTRY: dict[InvariantId, Checker] = {
 }
 
 
-REGISTERED_INVARIANT_IDS: tuple[str, ...] = tuple(invariant_id.value for invariant_id in REGISTRY)
+REGISTERED_INVARIANT_IDS: tuple[str, ...] = (
+    "authorization.scope.v1",
+    "prediction_availability.v1",
+    "evidence_link_completeness.v1",
+    "prediction_outcome_binding.v1",
+    "explainable_halt_payload.v1",
+)
 
 
 REGISTERED_INVARIANT_BRANCH_BEHAVIORS: dict[InvariantId, InvariantBranchBehavior] = {
@@ -383,9 +426,10 @@ def default_check_context(
     prediction_outcome: Mapping[str, Any] | None = None,
     authorization_allowed: bool | None = None,
     authorization_context: Mapping[str, Any] | None = None,
+    now_iso: str | None = None,
 ) -> InvariantCheckContext:
     return InvariantCheckContext(
-        now_iso=datetime.now(UTC).isoformat(),
+        now_iso=datetime.now(UTC).isoformat() if now_iso is None else now_iso,
         scope=scope,
         prediction_key=prediction_key,
         current_predictions=current_predictions,
@@ -401,24 +445,38 @@ def default_check_context(
 def run_checkers(
     *, gate: str, ctx: CheckContext, invariant_ids: Sequence[InvariantId]
 ) -> tuple[InvariantOutcome, ...]:
-    return tuple(REGISTRY[invariant_id](ctx) for invariant_id in invariant_ids)
+    # Bound per call (not at import) so REGISTRY stays the live dispatch table.
+    registry = REGISTRY
+    return tuple([registry[invariant_id](ctx) for invariant_id in invariant_ids])
 
 
 def normalize_outcome(outcome: InvariantOutcome, *, gate: str = "") -> CheckerResult:
+    # Pass outcomes usually carry no evidence or hints; skip building empty tuples for them.
+    evidence = outcome.evidence
+    action_hints = outcome.action_hints
     return CheckerResult(
         gate=gate,
-        invariant_id=outcome.invariant_id.value,
+        invariant_id=_ENUM_VALUES[outcome.invariant_id],
         passed=outcome.passed,
         reason=outcome.reason,
-        flow=outcome.flow.value,
-        validity=outcome.validity.value,
+        flow=_ENUM_VALUES[outcome.flow],
+        validity=_ENUM_VALUES[outcome.validity],
         code=outcome.code,
-        evidence=tuple(_normalize_evidence_item(item) for item in outcome.evidence),
+        evidence=tuple([_normalize_evidence_item(item) for item in evidence]) if evidence else (),
         details=_normalize_mapping(outcome.details),
-        action_hints=tuple(_normalize_mapping(item) for item in (outcome.action_hints or ())),
+        action_hints=(
+            tuple([_normalize_mapping(item) for item in action_hints]) if action_hints else ()
+        ),
     )
 
 
+def normalize_outcomes(
+    outcomes: Sequence[InvariantOutcome], *, gate: str = ""
+) -> tuple[CheckerResult, ...]:
+    """Batch form of `normalize_outcome` for one gate's outcomes."""
+    return tuple([normalize_outcome(outcome, gate=gate) for outcome in outcomes])
+
+
 def repair_mode_enabled(
     mode: InvariantHandlingMode | str = InvariantHandlingMode.STRICT_HALT,
 ) -> bool:
@@ -431,11 +489,12 @@ def _normalize_evidence_item(item: EvidenceRef | Mapping[str, Any]) -> EvidenceR
         return item
 
     kind = str(item.get("kind") or "unknown")
-    ref = item.get("ref", item.get("value", ""))
+    # Only fall back to "value" when "ref" is absent; avoids a second lookup otherwise.
+    ref = item["ref"] if "ref" in item else item.get("value", "")
     return EvidenceRef(kind=kind, ref=str(ref))
 
 
 def _normalize_mapping(item: Mapping[str, Any] | None) -> Mapping[str, Any]:
-    if item is None:
+    if not item:
         return {}
-    return {str(k): item[k] for k in item}
+    return {str(k): v for k, v in item.items()}
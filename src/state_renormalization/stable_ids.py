@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .gherkin_document import GherkinDocument
@@ -13,19 +13,71 @@ def _sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+# `json.dumps` builds a fresh JSONEncoder whenever non-default options are passed; one
+# configured instance produces the same text without the per-call construction.
+_CANON_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
 def _canon(obj: Any) -> str:
     """
     Canonical JSON string (stable across runs) for hashing.
     """
-    return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return _CANON_ENCODER.encode(obj)
+
+
+_json_str = json.encoder.encode_basestring  # the quoting `_canon` applies to str values
+
+
+def _json_int(value: int | None) -> str:
+    return str(value) if type(value) is int else json.dumps(value)
+
+
+# The key builders below emit exactly `_canon(...)` of the documented key objects (keys in
+# sorted order), without building the dict or running the JSON encoder per step. The
+# resulting ids are persisted, so any change here must keep the text byte-identical.
+
+
+def _feature_key_json(uri: str, feature: str, line: int | None, col: int | None) -> str:
+    return (
+        f'{{"col":{_json_int(col)},"feature":{_json_str(feature)},'
+        f'"line":{_json_int(line)},"uri":{_json_str(uri)}}}'
+    )
 
 
-@dataclass(frozen=True)
+def _scenario_key_json(
+    feature_id: str, keyword: str, name: str, line: int | None, col: int | None
+) -> str:
+    return (
+        f'{{"col":{_json_int(col)},"feature_id":{_json_str(feature_id)},'
+        f'"keyword":{_json_str(keyword)},"line":{_json_int(line)},"name":{_json_str(name)}}}'
+    )
+
+
+def _step_key_json(
+    scenario_id: str,
+    keyword_type: str,
+    keyword: str,
+    text: str,
+    line: int | None,
+    col: int | None,
+) -> str:
+    return (
+        f'{{"col":{_json_int(col)},"keyword":{_json_str(keyword)},'
+        f'"keywordType":{_json_str(keyword_type)},"line":{_json_int(line)},'
+        f'"scenario_id":{_json_str(scenario_id)},"text":{_json_str(text)}}}'
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class StableIds:
     uri: str
     feature_id: str
     scenario_ids: dict[str, str]  # key: scenario_key -> scenario_id
     step_ids: dict[str, str]  # key: step_key -> step_id
+    # Reverse lookups (first occurrence in document order wins).
+    scenario_id_by_name: dict[str, str] = field(default_factory=dict)
+    step_id_by_text: dict[str, str] = field(default_factory=dict)
+    step_id_by_scenario_and_text: dict[tuple[str, str], str] = field(default_factory=dict)
 
 
 def derive_stable_ids(gherkin_document: GherkinDocument, *, uri: str | None = None) -> StableIds:
@@ -36,65 +88,59 @@ def derive_stable_ids(gherkin_document: GherkinDocument, *, uri: str | None = No
     doc_uri = uri or gherkin_document.uri
     feature = gherkin_document.feature
     feature_name = feature.name
-    f_line = feature.location.line
-    f_col = feature.location.column
+    f_loc = feature.location
+    f_line, f_col = f_loc.line, f_loc.column
 
     # Feature ID: uri + feature name (+ location as tie-breaker)
-    feature_key_obj = {
-        "uri": doc_uri,
-        "feature": feature_name,
-        "line": f_line,
-        "col": f_col,
-    }
-    feature_id = "feat_" + _sha256_hex(_canon(feature_key_obj))
+    feature_id = "feat_" + _sha256_hex(_feature_key_json(doc_uri, feature_name, f_line, f_col))
 
     scenario_ids: dict[str, str] = {}
     step_ids: dict[str, str] = {}
+    scenario_id_by_name: dict[str, str] = {}
+    step_id_by_text: dict[str, str] = {}
+    step_id_by_scenario_and_text: dict[tuple[str, str], str] = {}
 
     for scenario in feature.scenarios:
         s_name = scenario.name
         s_keyword = scenario.keyword
-        s_line = scenario.location.line
-        s_col = scenario.location.column
-
-        scenario_key_obj = {
-            "feature_id": feature_id,
-            "keyword": s_keyword,
-            "name": s_name,
-            "line": s_line,
-            "col": s_col,
-        }
-        scenario_id = "scn_" + _sha256_hex(_canon(scenario_key_obj))
+        s_loc = scenario.location
+        s_line, s_col = s_loc.line, s_loc.column
+
+        # Key object: feature_id, keyword, name, line, col.
+        scenario_id = "scn_" + _sha256_hex(
+            _scenario_key_json(feature_id, s_keyword, s_name, s_line, s_col)
+        )
 
         # Scenario "key" is a deterministic string you can use in logs/debugging
         scenario_key = f"{s_keyword}:{s_name}@{s_line}:{s_col}"
         scenario_ids[scenario_key] = scenario_id
+        scenario_id_by_name.setdefault(s_name, scenario_id)
 
         for step in scenario.steps:
             st_text = step.text
             st_type = step.keyword_type
             st_keyword = step.keyword
-            st_line = step.location.line
-            st_col = step.location.column
-
-            step_key_obj = {
-                "scenario_id": scenario_id,
-                "keywordType": st_type,
-                "keyword": st_keyword,
-                "text": st_text,
-                "line": st_line,
-                "col": st_col,
-            }
-            step_id = "stp_" + _sha256_hex(_canon(step_key_obj))
+            st_loc = step.location
+            st_line, st_col = st_loc.line, st_loc.column
+
+            # Key object: scenario_id, keywordType, keyword, text, line, col.
+            step_id = "stp_" + _sha256_hex(
+                _step_key_json(scenario_id, st_type, st_keyword, st_text, st_line, st_col)
+            )
 
             step_key = f"{scenario_key}::{st_type}:{st_text}@{st_line}:{st_col}"
             step_ids[step_key] = step_id
+            step_id_by_text.setdefault(st_text, step_id)
+            step_id_by_scenario_and_text.setdefault((scenario_id, st_text), step_id)
 
     return StableIds(
         uri=doc_uri,
         feature_id=feature_id,
         scenario_ids=scenario_ids,
         step_ids=step_ids,
+        scenario_id_by_name=scenario_id_by_name,
+        step_id_by_text=step_id_by_text,
+        step_id_by_scenario_and_text=step_id_by_scenario_and_text,
     )
 
 
@@ -107,12 +153,12 @@ def derive_prediction_id(
     distribution_kind: str,
     distribution_params: dict[str, Any],
 ) -> str:
-    key_obj = {
-        "scope_key": scope_key,
-        "horizon_iso": horizon_iso,
-        "issued_at_iso": issued_at_iso,
-        "filtration_id": filtration_id,
-        "distribution_kind": distribution_kind,
-        "distribution_params": distribution_params,
-    }
-    return "pred_" + _sha256_hex(_canon(key_obj))
+    # Key object: scope_key, horizon_iso, issued_at_iso, filtration_id, distribution_kind,
+    # distribution_params. Only the caller-supplied params go through the JSON encoder.
+    key_json = (
+        f'{{"distribution_kind":{_json_str(distribution_kind)},'
+        f'"distribution_params":{_canon(distribution_params)},'
+        f'"filtration_id":{_json_str(filtration_id)},"horizon_iso":{_json_str(horizon_iso)},'
+        f'"issued_at_iso":{_json_str(issued_at_iso)},"scope_key":{_json_str(scope_key)}}}'
+    )
+    return "pred_" + _sha256_hex(key_json)
@@ -36,6 +36,16 @@ CONTRACT_SENSITIVE_EXACT = {
 }
 
 
+# Built once per session; factories hand out copies with fresh lists so tests can mutate them.
+_DEFAULT_CAPABILITIES: tuple[str, ...] = (
+    "baseline.dialog",
+    "baseline.schema_selection",
+    "baseline.invariant_evaluation",
+    "baseline.evaluation",
+)
+_DEFAULT_OBSERVER = default_observer_frame()
+
+
 def _is_contract_sensitive(nodeid: str) -> bool:
     path = nodeid.split("::", 1)[0]
     return path.startswith(CONTRACT_SENSITIVE_PREFIXES) or path in CONTRACT_SENSITIVE_EXACT
@@ -49,12 +59,18 @@ def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
             item.add_marker("general_behavior")
 
 
-@pytest.fixture
-def belief() -> BeliefState:
-    return BeliefState()
+@pytest.fixture(scope="session")
+def make_belief() -> Callable[[], BeliefState]:
+    return BeliefState
 
 
 @pytest.fixture
+def belief(make_belief: Callable[[], BeliefState]) -> BeliefState:
+    # Function-scoped: BeliefState is mutable, so every test gets a fresh one.
+    return make_belief()
+
+
+@pytest.fixture(scope="session")
 def make_policy_decision() -> Callable[..., VerbosityDecision]:
     def _make_policy_decision(
         *,
@@ -82,7 +98,7 @@ def make_policy_decision() -> Callable[..., VerbosityDecision]:
     return _make_policy_decision
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_ask_result() -> Callable[..., AskResult]:
     def _make_ask_result(
         *,
@@ -102,7 +118,7 @@ def make_ask_result() -> Callable[..., AskResult]:
     return _make_ask_result
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_episode(
     make_policy_decision: Callable[..., VerbosityDecision],
     make_ask_result: Callable[..., AskResult],
@@ -122,7 +138,12 @@ def make_episode(
     ) -> Episode:
         episode_observer = observer
         if episode_observer is None and with_default_observer:
-            episode_observer = default_observer_frame()
+            episode_observer = _DEFAULT_OBSERVER.model_copy(
+                update={
+                    "capabilities": list(_DEFAULT_OBSERVER.capabilities),
+                    "evaluation_invariants": list(_DEFAULT_OBSERVER.evaluation_invariants),
+                }
+            )
 
         return Episode(
             episode_id=episode_id,
@@ -142,7 +163,7 @@ def make_episode(
     return _make_episode
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_observer() -> Callable[..., ObserverFrame]:
     def _make_observer(
         *,
@@ -153,13 +174,7 @@ def make_observer() -> Callable[..., ObserverFrame]:
     ) -> ObserverFrame:
         return ObserverFrame(
             role=role,
-            capabilities=capabilities
-            or [
-                "baseline.dialog",
-                "baseline.schema_selection",
-                "baseline.invariant_evaluation",
-                "baseline.evaluation",
-            ],
+            capabilities=capabilities or list(_DEFAULT_CAPABILITIES),
             authorization_level=authorization_level,
             evaluation_invariants=evaluation_invariants or [],
         )
@@ -167,7 +182,7 @@ def make_observer() -> Callable[..., ObserverFrame]:
     return _make_observer
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_observation() -> Callable[..., Observation]:
     def _make_observation(
         *,
@@ -188,7 +203,7 @@ def make_observation() -> Callable[..., Observation]:
     return _make_observation
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_schema_selection() -> Callable[..., SchemaSelection]:
     class _SchemaSelectionKwargs(TypedDict, total=False):
         schemas: list[SchemaHit]
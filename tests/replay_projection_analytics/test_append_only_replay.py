@@ -60,7 +60,7 @@ def test_append_only_replay_reconstructs_projection_state_deterministically(
     replay_once = replay_projection_analytics(prediction_log)
     replay_twice = replay_projection_analytics(prediction_log)
 
-    assert replay_once.model_dump(mode="json") == replay_twice.model_dump(mode="json")
+    assert replay_once == replay_twice
     assert (
         replay_once.projection_state.current_predictions.keys()
         == online_projection.current_predictions.keys()
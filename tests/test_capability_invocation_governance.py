@@ -31,7 +31,7 @@ def _prediction(prediction_id: str, scope_key: str) -> PredictionRecord:
 
 
 def test_capability_invocation_allows_side_effect_after_policy_checks(
-    make_episode, make_observer
+    tmp_path: Path, make_episode, make_observer
 ) -> None:
     pred = _prediction("pred:allow", "scope:allow")
     projection = ProjectionState(
@@ -39,11 +39,8 @@ def test_capability_invocation_allows_side_effect_after_policy_checks(
     )
     ep = make_episode(observer=make_observer(capabilities=["baseline.invariant_evaluation"]))
 
-    log_path = Path("artifacts/test-capability-allow.jsonl")
-    halt_path = Path("artifacts/test-capability-allow-halts.jsonl")
-    for p in (log_path, halt_path):
-        if p.exists():
-            p.unlink()
+    log_path = tmp_path / "test-capability-allow.jsonl"
+    halt_path = tmp_path / "test-capability-allow-halts.jsonl"
 
     result = append_prediction_record(
         pred,
@@ -66,7 +63,7 @@ def test_capability_invocation_allows_side_effect_after_policy_checks(
 
 
 def test_capability_invocation_denial_persists_explainable_halt_and_skips_side_effect(
-    make_episode,
+    tmp_path: Path, make_episode
 ) -> None:
     pred = _prediction("pred:deny", "scope:deny")
     projection = ProjectionState(
@@ -74,11 +71,8 @@ def test_capability_invocation_denial_persists_explainable_halt_and_skips_side_e
     )
     ep = make_episode()
 
-    log_path = Path("artifacts/test-capability-deny.jsonl")
-    halt_path = Path("artifacts/test-capability-deny-halts.jsonl")
-    for p in (log_path, halt_path):
-        if p.exists():
-            p.unlink()
+    log_path = tmp_path / "test-capability-deny.jsonl"
+    halt_path = tmp_path / "test-capability-deny-halts.jsonl"
 
     result = append_prediction_record(
         pred,
@@ -100,16 +94,13 @@ def test_capability_invocation_denial_persists_explainable_halt_and_skips_side_e
 
 
 def test_capability_invocation_denial_requires_current_prediction_context(
-    make_episode,
+    tmp_path: Path, make_episode
 ) -> None:
     ep = make_episode()
     projection = ProjectionState(current_predictions={}, updated_at_iso="2026-02-13T00:00:00+00:00")
 
-    log_path = Path("artifacts/test-capability-current-prediction-required.jsonl")
-    halt_path = Path("artifacts/test-capability-current-prediction-required-halts.jsonl")
-    for p in (log_path, halt_path):
-        if p.exists():
-            p.unlink()
+    log_path = tmp_path / "test-capability-current-prediction-required.jsonl"
+    halt_path = tmp_path / "test-capability-current-prediction-required-halts.jsonl"
 
     policy_decision = _capability_invocation_policy_decision(
         observer=ep.observer,
@@ -146,24 +137,24 @@ def test_capability_invocation_denial_requires_current_prediction_context(
     ]
 
     expected_ref = {"kind": "jsonl", "ref": f"{halt_path.name}@{meta['lineno']}"}
-    denial_artifact = next(a for a in ep.artifacts if a.get("artifact_kind") == "capability_policy_denial")
-    halt_observation = next(a for a in ep.artifacts if a.get("artifact_kind") == "halt_observation")
-    assert denial_artifact["halt_evidence_ref"] == expected_ref
-    assert halt_observation["halt_evidence_ref"] == expected_ref
+    artifacts_by_kind: dict[object, dict[str, object]] = {}
+    for artifact in ep.artifacts:  # first artifact of each kind, like next(...) would pick
+        artifacts_by_kind.setdefault(artifact.get("artifact_kind"), artifact)
+    assert artifacts_by_kind["capability_policy_denial"]["halt_evidence_ref"] == expected_ref
+    assert artifacts_by_kind["halt_observation"]["halt_evidence_ref"] == expected_ref
 
 
-def test_capability_invocation_adapter_failure_persists_halt(monkeypatch, make_episode) -> None:
+def test_capability_invocation_adapter_failure_persists_halt(
+    tmp_path: Path, monkeypatch, make_episode
+) -> None:
     pred = _prediction("pred:adapter-failure", "scope:adapter-failure")
     projection = ProjectionState(
         current_predictions={pred.scope_key: pred}, updated_at_iso="2026-02-13T00:00:00+00:00"
     )
     ep = make_episode()
 
-    log_path = Path("artifacts/test-capability-adapter-failure.jsonl")
-    halt_path = Path("artifacts/test-capability-adapter-failure-halts.jsonl")
-    for p in (log_path, halt_path):
-        if p.exists():
-            p.unlink()
+    log_path = tmp_path / "test-capability-adapter-failure.jsonl"
+    halt_path = tmp_path / "test-capability-adapter-failure-halts.jsonl"
 
     def _raise(*args, **kwargs):
         raise OSError("disk full")
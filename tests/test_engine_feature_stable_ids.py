@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from state_renormalization.contracts import Episode
+from state_renormalization.engine import (
+    _append_episode_artifact,
+    _episode_stable_ids,
+    _feature_stable_ids,
+    _find_stable_ids_from_payload,
+)
+
+FEATURE_TEXT = """Feature: Demo
+  Scenario: first
+    Given hello
+    Then goodbye
+
+  Scenario: second
+    Given hello
+"""
+
+
+def _write_feature(tmp_path: Path, text: str = FEATURE_TEXT) -> Path:
+    feature_path = tmp_path / "demo.feature"
+    feature_path.write_text(text, encoding="utf-8")
+    return feature_path
+
+
+def test_find_stable_ids_resolves_scenario_and_step_by_name(tmp_path: Path) -> None:
+    feature_path = _write_feature(tmp_path)
+
+    first = _find_stable_ids_from_payload(
+        {"feature_uri": str(feature_path), "scenario_name": "first", "step_text": "hello"}
+    )
+    second = _find_stable_ids_from_payload(
+        {"feature_uri": str(feature_path), "scenario_name": "second", "step_text": "hello"}
+    )
+    any_scenario = _find_stable_ids_from_payload(
+        {"feature_uri": str(feature_path), "step_text": "hello"}
+    )
+
+    assert set(first) == {"feature_id", "scenario_id", "step_id"}
+    assert first["feature_id"] == second["feature_id"]
+    assert first["scenario_id"] != second["scenario_id"]
+    assert first["step_id"] != second["step_id"]
+    assert any_scenario == {"feature_id": first["feature_id"], "step_id": first["step_id"]}
+
+
+def test_find_stable_ids_reuses_parse_until_feature_file_changes(tmp_path: Path) -> None:
+    feature_path = _write_feature(tmp_path)
+    payload = {"feature_uri": str(feature_path), "scenario_name": "first"}
+
+    hits_before = _feature_stable_ids.cache_info().hits
+    original = _find_stable_ids_from_payload(payload)
+    assert _find_stable_ids_from_payload(payload) == original
+    assert _feature_stable_ids.cache_info().hits == hits_before + 1
+
+    feature_path.write_text(FEATURE_TEXT.replace("Feature: Demo", "Feature: Renamed"), "utf-8")
+    stat = feature_path.stat()
+    os.utime(feature_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _find_stable_ids_from_payload(payload)["feature_id"] != original["feature_id"]
+
+
+def test_find_stable_ids_returns_empty_for_missing_feature_file(tmp_path: Path) -> None:
+    assert _find_stable_ids_from_payload({"feature_uri": str(tmp_path / "missing.feature")}) == {}
+
+
+def _episode(artifacts: list[dict[str, object]]) -> Episode:
+    return Episode.model_construct(episode_id="ep:test", artifacts=artifacts)
+
+
+def test_episode_stable_ids_see_artifacts_appended_later() -> None:
+    ep = _episode([{"artifact_kind": "plain"}])
+    assert _episode_stable_ids(ep) == {}
+
+    _append_episode_artifact(ep, {"artifact_kind": "marker", "feature_id": "feat:1"})
+    _append_episode_artifact(ep, {"artifact_kind": "after"})
+
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:1"}
+    assert ep.artifacts[-1] == {"feature_id": "feat:1", "artifact_kind": "after"}
+
+
+def test_episode_stable_ids_rescan_when_artifacts_are_replaced() -> None:
+    ep = _episode([{"feature_id": "feat:old", "scenario_id": "scn:old"}])
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:old", "scenario_id": "scn:old"}
+
+    ep.artifacts = [{"feature_id": "feat:new"}]
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:new"}
+
+    ep.artifacts[0] = {"artifact_kind": "plain"}
+    assert _episode_stable_ids(ep) == {}
+
+
+def test_episode_stable_ids_follow_in_place_edits_of_earlier_artifacts() -> None:
+    ep = _episode([{"artifact_kind": "marker", "feature_id": "feat:old"}, {"artifact_kind": "x"}])
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:old"}
+
+    ep.artifacts[0]["feature_id"] = "feat:edited"
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:edited"}
+
+    ep.artifacts[0] = {"artifact_kind": "plain"}
+    ep.artifacts[1]["feature_id"] = "feat:later"
+    assert _episode_stable_ids(ep) == {"feature_id": "feat:later"}
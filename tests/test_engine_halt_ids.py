@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from state_renormalization.contracts import EvidenceRef
+from state_renormalization.engine import _stable_halt_id, _to_dict, sha1_text
+from state_renormalization.invariants import Flow, InvariantId, InvariantOutcome, Validity
+
+
+@pytest.mark.parametrize(
+    ("basis", "expected"),
+    [
+        ("", "da39a3ee5e"),
+        ("pre-decision|x|y", "678ff02b75"),
+        ("é", "bf15be717a"),
+    ],
+)
+def test_sha1_text_digests_stay_compatible_with_persisted_ids(basis: str, expected: str) -> None:
+    assert sha1_text(basis) == expected
+
+
+@pytest.mark.parametrize(
+    "evidence",
+    [
+        (),
+        (EvidenceRef(kind="scope", ref="scope:test"),),
+        (
+            EvidenceRef(kind="prediction_key", ref='it\'s "quoted"'),
+            EvidenceRef(kind="scope", ref="scope:é"),
+            {"kind": "raw", "ref": "mapping"},
+        ),
+    ],
+)
+def test_stable_halt_id_matches_dumped_evidence_basis(evidence: tuple[object, ...]) -> None:
+    outcome = InvariantOutcome(
+        invariant_id=InvariantId.PREDICTION_AVAILABILITY,
+        passed=False,
+        reason="no current prediction",
+        flow=Flow.STOP,
+        validity=Validity.INVALID,
+        code="no_current_prediction",
+        evidence=evidence,  # type: ignore[arg-type]
+    )
+    legacy_basis = "|".join(
+        [
+            "pre-decision:pre_consume",
+            outcome.invariant_id.value,
+            outcome.reason,
+            ",".join(sorted(str(_to_dict(item)) for item in evidence)),
+        ]
+    )
+
+    assert _stable_halt_id(stage="pre-decision:pre_consume", outcome=outcome) == (
+        f"halt:{sha1_text(legacy_basis)}"
+    )
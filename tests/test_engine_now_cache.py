@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from state_renormalization._compat import UTC
+from state_renormalization.contracts import (
+    AskResult,
+    AskStatus,
+    BeliefState,
+    Episode,
+    PredictionRecord,
+    ProjectionState,
+    RepairResolution,
+)
+from state_renormalization.engine import _now_cache, _now_iso, run_mission_loop
+from state_renormalization.invariants import InvariantHandlingMode
+
+
+def test_now_iso_is_pinned_within_one_pass_and_fresh_outside() -> None:
+    with _now_cache():
+        first = _now_iso()
+        time.sleep(0.001)
+        with _now_cache():
+            assert _now_iso() == first
+        assert _now_iso() == first
+
+    time.sleep(0.001)
+    assert _now_iso() != first
+
+
+def test_now_cache_decorator_starts_a_new_pass_per_call() -> None:
+    @_now_cache()
+    def stamp() -> str:
+        return _now_iso()
+
+    first = stamp()
+    time.sleep(0.001)
+    assert stamp() != first
+
+
+def test_mission_loop_timestamps_after_a_hook_are_not_pinned_to_loop_start(
+    make_episode: Callable[..., Episode], tmp_path: Path
+) -> None:
+    episode = make_episode(conversation_id="conv:now-cache-hook", turn_index=1)
+    hook_returned_at: list[str] = []
+
+    def slow_hook(*, phase: str, **_kwargs: object) -> dict[str, str]:
+        if phase != "mission_loop:start":
+            return {"action": "none"}
+        time.sleep(0.002)  # e.g. a HITL wait
+        hook_returned_at.append(datetime.now(UTC).isoformat())
+        return {
+            "action": "resume",
+            "reason": "operator resumed",
+            "override_source": "operator",
+            "override_provenance": "ticket:now-cache",
+        }
+
+    run_mission_loop(
+        episode,
+        BeliefState(),
+        ProjectionState(current_predictions={}, updated_at_iso="2026-02-13T00:00:00+00:00"),
+        prediction_log_path=tmp_path / "predictions.jsonl",
+        intervention_hook=slow_hook,
+    )
+
+    lifecycle = next(
+        a for a in episode.artifacts if a.get("artifact_kind") == "intervention_lifecycle"
+    )
+    assert lifecycle["action"] == "resume"
+    assert lifecycle["responded_at_iso"] >= hook_returned_at[0]
+
+
+def test_reconcile_timestamps_after_the_repair_policy_are_not_pinned(
+    make_episode: Callable[..., Episode],
+    make_ask_result: Callable[..., AskResult],
+    tmp_path: Path,
+) -> None:
+    pred = PredictionRecord.model_validate(
+        {
+            "prediction_id": "pred:now-cache-policy",
+            "scope_key": "turn:1",
+            "prediction_key": "turn:1:user_response_present",
+            "prediction_target": "user_response_present",
+            "filtration_id": "conversation:now-cache-policy",
+            "target_variable": "user_response_present",
+            "target_horizon_iso": "2026-02-13T00:00:00+00:00",
+            "expectation": 0.1,
+            "issued_at_iso": "2026-02-13T00:00:00+00:00",
+        }
+    )
+    episode = make_episode(
+        conversation_id="conv:now-cache-policy",
+        turn_index=1,
+        ask=make_ask_result(status=AskStatus.OK, sentence="yes"),
+    )
+    policy_returned_at: list[str] = []
+
+    def slow_policy(_proposal: object) -> RepairResolution:
+        time.sleep(0.002)  # e.g. a human review of the repair proposal
+        policy_returned_at.append(datetime.now(UTC).isoformat())
+        return RepairResolution.REJECTED
+
+    _, _, projection = run_mission_loop(
+        episode,
+        BeliefState(),
+        ProjectionState(
+            current_predictions={pred.scope_key: pred},
+            prediction_history=[pred],
+            updated_at_iso=pred.issued_at_iso,
+        ),
+        pending_predictions=[],
+        prediction_log_path=tmp_path / "predictions.jsonl",
+        invariant_handling_mode=InvariantHandlingMode.REPAIR_EVENTS,
+        repair_acceptance_policy=slow_policy,
+    )
+
+    assert policy_returned_at
+    assert projection.last_comparison_at_iso is not None
+    assert projection.last_comparison_at_iso >= policy_returned_at[-1]
@@ -62,6 +62,7 @@ def test_run_mission_loop_updates_projection_before_decision_stages(
     assert ep_out.observations
     assert any(a.get("artifact_kind") == "turn_summary" for a in ep_out.artifacts)
     assert projection_out.correction_metrics.get("comparisons", 0.0) >= 1.0
+    assert ProjectionState.model_validate(projection_out.model_dump()) == projection_out
 
     events = [rec for _, rec in read_jsonl(tmp_path / "predictions.jsonl")]
     prediction_event = events[0]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import pytest
+
+from state_renormalization import engine
+from state_renormalization.adapters import schema_selector
+from state_renormalization.contracts import (
+    CaptureOutcome,
+    CaptureStatus,
+    Episode,
+    Observation,
+    ObservationType,
+    UtteranceType,
+)
+from state_renormalization.engine import classify_utterance, extract_user_utterance
+
+
+@pytest.mark.parametrize(
+    ("sentence", "expected"),
+    [
+        (None, UtteranceType.NONE),
+        ("   ", UtteranceType.NONE),
+        ("quit", UtteranceType.EXIT_INTENT),
+        ("  Stop  ", UtteranceType.EXIT_INTENT),
+        (
+            "let's pick this up later when the whole team has reviewed the plan",
+            UtteranceType.EXIT_INTENT,
+        ),
+        ("Thanks!", UtteranceType.LOW_SIGNAL),
+        ("good question, i am not sure", UtteranceType.LOW_SIGNAL),
+        (
+            "thanks, now please schedule the reminder for the garage door at seven tonight",
+            UtteranceType.NORMAL,
+        ),
+        ("remind me to water the plants", UtteranceType.NORMAL),
+    ],
+)
+def test_classify_utterance_branches(sentence: str | None, expected: UtteranceType) -> None:
+    assert classify_utterance(sentence, None) == expected
+
+
+def test_classify_utterance_no_response_wins_over_text() -> None:
+    error = CaptureOutcome(status=CaptureStatus.NO_RESPONSE)
+
+    assert classify_utterance("quit", error) == UtteranceType.NONE
+
+
+def _observation(kind: ObservationType, text: str | None) -> Observation:
+    return Observation(observation_id=f"obs:{kind}", t_observed_iso="t0", type=kind, text=text)
+
+
+def test_extract_user_utterance_returns_first_utterance_only() -> None:
+    ep = Episode.model_construct(
+        observations=[
+            _observation(ObservationType.SILENCE, None),
+            _observation(ObservationType.USER_UTTERANCE, "  turn on the light  "),
+            _observation(ObservationType.USER_UTTERANCE, "later text"),
+        ]
+    )
+
+    assert extract_user_utterance(ep) == "turn on the light"
+
+    ep.observations[1] = _observation(ObservationType.USER_UTTERANCE, "   ")
+    assert extract_user_utterance(ep) is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [*sorted(schema_selector.EXIT_EXACT), *schema_selector.EXIT_PHRASES, "remind me at seven"],
+)
+def test_engine_and_schema_selector_agree_on_exit_intent(text: str) -> None:
+    assert engine.is_exit_intent(text) == schema_selector.is_exit_intent(text)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import pickle
+from dataclasses import FrozenInstanceError
+from datetime import datetime
+
+import pytest
+
+from state_renormalization._compat import UTC
 from state_renormalization.contracts import EvidenceRef
 from state_renormalization.invariants import (
+    REGISTERED_INVARIANT_IDS,
+    REGISTRY,
     Flow,
     InvariantId,
     InvariantOutcome,
     Validity,
+    _ok,
     check_authorization_scope,
     check_evidence_link_completeness,
     check_explainable_halt_payload,
@@ -13,9 +23,14 @@ from state_renormalization.invariants import (
     check_prediction_outcome_binding,
     default_check_context,
     normalize_outcome,
+    normalize_outcomes,
 )
 
 
+def test_registered_invariant_ids_match_registry_order() -> None:
+    assert REGISTERED_INVARIANT_IDS == tuple(invariant_id.value for invariant_id in REGISTRY)
+
+
 def test_authorization_scope_invariant_pass_and_fail_have_deterministic_shape() -> None:
     denied = check_authorization_scope(
         default_check_context(
@@ -182,6 +197,21 @@ def test_prediction_outcome_binding_invariant_fail_and_pass() -> None:
     assert normalized.passed is True
 
 
+def test_prediction_outcome_binding_rejects_bool_error_metric() -> None:
+    outcome = check_prediction_outcome_binding(
+        default_check_context(
+            scope="scope:test",
+            prediction_key="scope:test",
+            current_predictions={"scope:test": "pred:1"},
+            prediction_log_available=True,
+            prediction_outcome={"prediction_id": "pred:1", "error_metric": True},
+        )
+    )
+
+    assert outcome.passed is False
+    assert outcome.code == "non_numeric_error_metric"
+
+
 def test_normalized_invariant_outcome_has_stable_json_safe_shape_for_continue_and_stop() -> None:
     continue_outcome = check_prediction_availability(
         default_check_context(
@@ -218,3 +248,207 @@ def test_normalized_invariant_outcome_has_stable_json_safe_shape_for_continue_an
         }
         assert isinstance(normalized.details, dict)
         assert isinstance(normalized.action_hints, tuple)
+
+
+def test_not_applicable_pass_paths_build_fresh_outcomes() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key=None,
+        current_predictions={"scope:test": "pred:1"},
+        prediction_log_available=True,
+    )
+
+    checks = (
+        check_authorization_scope,
+        check_prediction_availability,
+        check_evidence_link_completeness,
+        check_prediction_outcome_binding,
+        check_explainable_halt_payload,
+    )
+    for check in checks:
+        first = check(ctx)
+        assert first.passed is True
+        assert first.flow is Flow.CONTINUE
+        assert isinstance(first.details, dict)
+        first.details["tamper"] = 1
+        second = check(ctx)
+        assert second is not first
+        assert "tamper" not in second.details
+        assert normalize_outcome(second).reason == (second.details.get("message") or second.code)
+
+
+def test_default_check_context_now_iso_matches_datetime_isoformat() -> None:
+    before = datetime.now(UTC)
+    now_iso = default_check_context(
+        scope="scope:test",
+        prediction_key=None,
+        current_predictions={},
+        prediction_log_available=True,
+    ).now_iso
+    after = datetime.now(UTC)
+
+    parsed = datetime.fromisoformat(now_iso)
+    assert before <= parsed <= after
+    assert now_iso == parsed.isoformat()
+
+    pinned = default_check_context(
+        scope="scope:test",
+        prediction_key=None,
+        current_predictions={},
+        prediction_log_available=True,
+        now_iso="2024-01-01T00:00:00+00:00",
+    )
+    assert pinned.now_iso == "2024-01-01T00:00:00+00:00"
+
+
+def test_normalize_outcome_coerces_mapping_evidence_and_keys() -> None:
+    outcome = InvariantOutcome(
+        invariant_id=InvariantId.PREDICTION_AVAILABILITY,
+        passed=False,
+        reason="missing",
+        flow=Flow.STOP,
+        validity=Validity.INVALID,
+        code="no_current_prediction",
+        evidence=(
+            {"kind": "scope", "ref": "scope:test", "value": "ignored"},  # type: ignore[arg-type]
+            {"value": 7},
+        ),
+        details={1: "halt"},  # type: ignore[dict-item]
+        action_hints=({},),
+    )
+
+    normalized = normalize_outcome(outcome)
+
+    assert normalized.evidence == (
+        EvidenceRef(kind="scope", ref="scope:test"),
+        EvidenceRef(kind="unknown", ref="7"),
+    )
+    assert normalized.details == {"1": "halt"}
+    assert normalized.action_hints == ({},)
+
+
+def test_normalize_outcomes_matches_per_outcome_normalization() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key="scope:test",
+        current_predictions={},
+        prediction_log_available=False,
+        authorization_allowed=False,
+        authorization_context={"action": "evaluate_invariant_gates"},
+    )
+    outcomes = (
+        check_authorization_scope(ctx),
+        check_prediction_availability(ctx),
+        check_evidence_link_completeness(ctx),
+    )
+
+    assert normalize_outcomes(outcomes, gate="pre-decision") == tuple(
+        normalize_outcome(outcome, gate="pre-decision") for outcome in outcomes
+    )
+    assert normalize_outcomes((), gate="pre-decision") == ()
+
+
+def test_slotted_outcomes_have_no_instance_dict_and_pickle_round_trip() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key="scope:test",
+        current_predictions={},
+        prediction_log_available=True,
+    )
+    outcome = check_prediction_availability(ctx)
+
+    for value in (ctx, outcome):
+        assert not hasattr(value, "__dict__")
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_outcomes_and_contexts_are_frozen() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key="scope:test",
+        current_predictions={},
+        prediction_log_available=True,
+    )
+    outcome = check_prediction_availability(ctx)
+    result = normalize_outcome(outcome)
+
+    with pytest.raises(FrozenInstanceError):
+        outcome.passed = True  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        result.passed = True  # type: ignore[misc]
+    with pytest.raises(FrozenInstanceError):
+        ctx.scope = "scope:other"  # type: ignore[misc]
+
+
+def test_scope_evidence_and_action_hints_are_fresh_per_outcome() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key="scope:test",
+        current_predictions={},
+        prediction_log_available=True,
+    )
+
+    first = check_prediction_availability(ctx)
+    second = check_prediction_availability(ctx)
+
+    assert first.evidence == (EvidenceRef(kind="scope", ref="scope:test"),)
+    assert second.evidence == first.evidence
+    assert second.evidence[0] is not first.evidence[0]
+    assert second.action_hints == first.action_hints
+    assert second.action_hints is not first.action_hints
+
+
+def test_prediction_log_unavailable_halts_do_not_share_mutable_state() -> None:
+    ctx = default_check_context(
+        scope="scope:test",
+        prediction_key="scope:test",
+        current_predictions={"scope:test": "pred:1"},
+        prediction_log_available=False,
+        just_written_prediction={"key": "scope:test", "evidence_refs": []},
+    )
+
+    first = check_evidence_link_completeness(ctx)
+    assert isinstance(first.details, dict)
+    assert first.action_hints is not None
+    first_hint = first.action_hints[0]
+    assert isinstance(first_hint, dict)
+    first.details["enriched"] = True
+    first_hint["enriched"] = True
+    second = check_evidence_link_completeness(ctx)
+
+    assert second.code == "prediction_log_unavailable"
+    assert second.details == {
+        "message": "Prediction write attempted without an available append log."
+    }
+    assert second.action_hints == ({"kind": "fallback", "action": "buffer_prediction"},)
+
+
+def test_ok_copies_caller_details() -> None:
+    details = {"message": "built by the caller"}
+
+    outcome = _ok(InvariantId.PREDICTION_AVAILABILITY, "caller_details", details)
+    details["message"] = "changed later"
+
+    assert outcome.details == {"message": "built by the caller"}
+    assert outcome.details is not details
+    assert outcome.reason == "built by the caller"
+
+
+def test_keyed_pass_outcomes_are_built_per_call() -> None:
+    def availability(key: str) -> InvariantOutcome:
+        return check_prediction_availability(
+            default_check_context(
+                scope="scope:test",
+                prediction_key=key,
+                current_predictions={"a": "pred:a", "b": "pred:b"},
+                prediction_log_available=True,
+            )
+        )
+
+    first = availability("a")
+    assert isinstance(first.details, dict)
+    first.details["prediction_key"] = "tampered"
+
+    assert availability("a") is not first
+    assert availability("a").details == {"prediction_key": "a"}
+    assert availability("b").details == {"prediction_key": "b"}
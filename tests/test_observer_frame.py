@@ -15,6 +15,7 @@ from state_renormalization.contracts import (
 )
 from state_renormalization.engine import (
     GateSuccessOutcome,
+    _observer_payload,
     apply_schema_bubbling,
     apply_utterance_interpretation,
     attach_decision_effect,
@@ -305,3 +306,19 @@ def test_policy_functions_block_unauthorized_actions(
         "apply_schema_bubbling",
         "apply_utterance_interpretation",
     }
+
+
+def test_observer_payload_matches_model_dump() -> None:
+    observer = ObserverFrame(
+        role="assistant",
+        capabilities=["baseline.dialog"],
+        authorization_level="baseline",
+        evaluation_invariants=["prediction_availability.v1"],
+    )
+
+    payload = _observer_payload(observer)
+
+    assert payload == observer.model_dump(mode="json")
+    assert list(payload) == list(ObserverFrame.model_fields)
+    assert payload["capabilities"] is not observer.capabilities
+    assert _observer_payload(None) is None
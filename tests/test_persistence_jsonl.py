@@ -2,16 +2,21 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import Callable
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
+from state_renormalization._compat import UTC
+from state_renormalization.adapters import persistence
 from state_renormalization.adapters.persistence import (
     append_halt,
     append_jsonl,
     append_mission_completed_event,
+    append_prediction,
     read_halt_record,
     read_jsonl,
 )
@@ -23,6 +28,13 @@ from state_renormalization.contracts import (
     MissionCompletionMode,
 )
 from state_renormalization.engine import to_jsonable_episode
+from state_renormalization.invariants import (
+    Flow,
+    InvariantId,
+    InvariantOutcome,
+    Validity,
+    normalize_outcome,
+)
 
 TEST_GATE = CapabilityAdapterGate(invocation_id="invoke:test", allowed=True)
 
@@ -30,8 +42,8 @@ TEST_GATE = CapabilityAdapterGate(invocation_id="invoke:test", allowed=True)
 def test_append_and_read_jsonl_roundtrip(tmp_path: Path) -> None:
     p = tmp_path / "events.jsonl"
 
-    append_jsonl(p, {"kind": "x", "n": 1})
-    append_jsonl(p, {"kind": "x", "n": 2})
+    assert append_jsonl(p, {"kind": "x", "n": 1}) == 1
+    assert append_jsonl(p, {"kind": "x", "n": 2}) == 2
 
     rows = [rec for _, rec in read_jsonl(p)]
     assert rows == [{"kind": "x", "n": 1}, {"kind": "x", "n": 2}]
@@ -42,6 +54,75 @@ def test_append_and_read_jsonl_roundtrip(tmp_path: Path) -> None:
         json.loads(ln)
 
 
+def test_append_jsonl_writes_utf8_lines(tmp_path: Path) -> None:
+    p = tmp_path / "events.jsonl"
+
+    append_jsonl(p, {"kind": "x", "text": "hyvää päivää"})
+    append_jsonl(p, {"kind": "x", "text": "hyvää päivää"})
+
+    raw_lines = p.read_bytes().split(b"\n")
+    assert raw_lines[-1] == b""
+    assert all("hyvää".encode() in line for line in raw_lines[:-1])
+    assert [rec for _, rec in read_jsonl(p)] == [{"kind": "x", "text": "hyvää päivää"}] * 2
+
+
+def test_append_jsonl_keeps_stdlib_encoding_of_non_finite_floats(tmp_path: Path) -> None:
+    p = tmp_path / "events.jsonl"
+
+    append_jsonl(p, {"err": float("nan"), "inf": float("inf"), "neg": float("-inf")})
+
+    assert p.read_text(encoding="utf-8") == '{"err": NaN, "inf": Infinity, "neg": -Infinity}\n'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime(2026, 2, 13, tzinfo=UTC), {1, 2}, b"raw", object()],
+    ids=["datetime", "set", "bytes", "object"],
+)
+def test_append_jsonl_rejects_non_json_values_without_writing(
+    tmp_path: Path, value: object
+) -> None:
+    p = tmp_path / "events.jsonl"
+
+    with pytest.raises(TypeError):
+        append_jsonl(p, {"kind": "x", "value": value})
+
+    assert not p.exists()
+
+
+def test_append_jsonl_serializes_dataclass_records_field_by_field(tmp_path: Path) -> None:
+    p = tmp_path / "events.jsonl"
+    result = normalize_outcome(
+        InvariantOutcome(
+            invariant_id=InvariantId.PREDICTION_AVAILABILITY,
+            passed=True,
+            reason="ok",
+            flow=Flow.CONTINUE,
+            validity=Validity.VALID,
+            code="current_prediction_available",
+            evidence=(EvidenceRef(kind="scope", ref="scope:test"),),
+            details={"scope": "scope:test"},
+        ),
+        gate="pre-decision",
+    )
+
+    append_jsonl(p, result)
+
+    [(_, row)] = list(read_jsonl(p))
+    assert row == {
+        "gate": "pre-decision",
+        "invariant_id": "prediction_availability.v1",
+        "passed": True,
+        "reason": "ok",
+        "flow": "continue",
+        "validity": "valid",
+        "code": "current_prediction_available",
+        "evidence": [{"kind": "scope", "ref": "scope:test"}],
+        "details": {"scope": "scope:test"},
+        "action_hints": [],
+    }
+
+
 def test_append_halt_jsonl_roundtrip_and_evidence_ref_format(tmp_path: Path) -> None:
     p = tmp_path / "halts.jsonl"
 
@@ -75,6 +156,65 @@ def test_append_halt_jsonl_roundtrip_and_evidence_ref_format(tmp_path: Path) ->
     assert line_no == "1"
 
 
+def test_append_prediction_evidence_refs_track_external_log_writes(tmp_path: Path) -> None:
+    p = tmp_path / "predictions.jsonl"
+
+    first = append_prediction(p, {"event_kind": "prediction", "n": 1}, adapter_gate=TEST_GATE)
+    second = append_prediction(p, {"event_kind": "prediction", "n": 2}, adapter_gate=TEST_GATE)
+    with p.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"event_kind": "prediction", "n": 3}) + "\n")
+    fourth = append_prediction(p, {"event_kind": "prediction", "n": 4}, adapter_gate=TEST_GATE)
+    p.write_text(json.dumps({"event_kind": "prediction", "n": 5}) + "\n", encoding="utf-8")
+    sixth = append_prediction(p, {"event_kind": "prediction", "n": 6}, adapter_gate=TEST_GATE)
+
+    assert [first["ref"], second["ref"], fourth["ref"], sixth["ref"]] == [
+        "predictions.jsonl@1",
+        "predictions.jsonl@2",
+        "predictions.jsonl@4",
+        "predictions.jsonl@2",
+    ]
+    assert [rec["n"] for _, rec in read_jsonl(p)] == [5, 6]
+
+
+def test_append_prediction_recounts_after_a_write_raced_by_another_writer(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    p = tmp_path / "predictions.jsonl"
+    real_fstat = os.fstat
+    fstat_calls = 0
+
+    def racing_fstat(fd: int) -> os.stat_result:
+        # The second fstat is the post-write one: another writer appends just before it.
+        nonlocal fstat_calls
+        fstat_calls += 1
+        if fstat_calls == 2:
+            with p.open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps({"event_kind": "prediction", "n": 2}) + "\n")
+        return real_fstat(fd)
+
+    monkeypatch.setattr(persistence.os, "fstat", racing_fstat)
+    first = append_prediction(p, {"event_kind": "prediction", "n": 1}, adapter_gate=TEST_GATE)
+    monkeypatch.setattr(persistence.os, "fstat", real_fstat)
+    third = append_prediction(p, {"event_kind": "prediction", "n": 3}, adapter_gate=TEST_GATE)
+
+    assert [first["ref"], third["ref"]] == ["predictions.jsonl@1", "predictions.jsonl@3"]
+    assert [rec["n"] for _, rec in read_jsonl(p)] == [1, 2, 3]
+
+
+def test_jsonl_line_count_cache_is_bounded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(persistence, "_JSONL_LINE_COUNTS", {})
+    monkeypatch.setattr(persistence, "_JSONL_LINE_COUNTS_MAX", 2)
+
+    for name in ("a", "b", "c"):
+        append_jsonl(tmp_path / f"{name}.jsonl", {"kind": name})
+
+    assert list(persistence._JSONL_LINE_COUNTS) == [
+        os.path.abspath(tmp_path / "b.jsonl"),
+        os.path.abspath(tmp_path / "c.jsonl"),
+    ]
+    assert append_jsonl(tmp_path / "a.jsonl", {"kind": "a"}) == 2
+
+
 def test_append_jsonl_propagates_stable_ids_to_nested_events(tmp_path: Path) -> None:
     p = tmp_path / "events.jsonl"
 
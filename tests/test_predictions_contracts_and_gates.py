@@ -1066,6 +1066,67 @@ def test_halt_artifact_includes_halt_evidence_ref_and_invariant_context(tmp_path
     assert halt_observation["invariant_id"] == "evidence_link_completeness.v1"
 
 
+def test_gate_without_artifact_emission_writes_nothing(tmp_path: Path) -> None:
+    pred = _fixed_prediction_record()
+    projected = project_current(
+        pred,
+        ProjectionState(current_predictions={}, updated_at_iso="2026-02-13T00:00:00+00:00"),
+    )
+    ep = _make_episode_with_artifacts()
+    halt_log_path = tmp_path / "halts.jsonl"
+
+    gate = evaluate_invariant_gates(
+        ep=ep,
+        scope=pred.scope_key,
+        prediction_key=pred.scope_key,
+        projection_state=projected,
+        prediction_log_available=True,
+        just_written_prediction={"key": pred.scope_key, "evidence_refs": []},
+        halt_log_path=halt_log_path,
+        emit_artifacts=False,
+    )
+
+    assert isinstance(gate, HaltRecord)
+    assert ep.artifacts == []
+    assert ep.observations == []
+    assert not halt_log_path.exists()
+
+
+def test_gate_halt_validation_reuses_explainable_halt_check(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pred = _fixed_prediction_record()
+    projected = project_current(
+        pred,
+        ProjectionState(current_predictions={}, updated_at_iso="2026-02-13T00:00:00+00:00"),
+    )
+    ep = _make_episode_with_artifacts()
+    explainable_halt = REGISTRY[InvariantId.EXPLAINABLE_HALT_PAYLOAD]
+    calls: list[InvariantOutcome | None] = []
+
+    def counting_checker(ctx: Any) -> InvariantOutcome:
+        calls.append(ctx.halt_candidate)
+        return explainable_halt(ctx)
+
+    monkeypatch.setitem(REGISTRY, InvariantId.EXPLAINABLE_HALT_PAYLOAD, counting_checker)
+
+    gate = evaluate_invariant_gates(
+        ep=ep,
+        scope=pred.scope_key,
+        prediction_key=pred.scope_key,
+        projection_state=projected,
+        prediction_log_available=True,
+        just_written_prediction={"key": pred.scope_key, "evidence_refs": []},
+        halt_log_path=tmp_path / "halts.jsonl",
+    )
+
+    assert isinstance(gate, HaltRecord)
+    assert len(calls) == 1
+    artifact = next(a for a in ep.artifacts if a.get("artifact_kind") == "invariant_outcomes")
+    assert artifact["invariant_checks"][-1]["gate_point"] == "halt_validation"
+    assert artifact["invariant_checks"][-1]["passed"] is True
+
+
 
 def test_invariant_halt_evidence_ref_matches_persisted_halt_row(tmp_path: Path) -> None:
     pred = _fixed_prediction_record()
@@ -1422,8 +1483,8 @@ def test_evaluate_invariant_gates_rejects_malformed_halt_outcome_payload(
     )
 
     monkeypatch.setattr(
-        "state_renormalization.engine._run_invariant",
-        lambda invariant_id, *, ctx: malformed,
+        "state_renormalization.engine._run_invariant_with_halt_validation",
+        lambda invariant_id, *, ctx: (malformed, None),
     )
 
     with pytest.raises(Exception, match="malformed or incomplete"):
@@ -1,8 +1,10 @@
 # tests/test_stable_ids.py
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from typing import Any
 
+import pytest
 from gherkin.parser import Parser
 from gherkin.token_scanner import TokenScanner
 
@@ -50,6 +52,18 @@ def test_stable_ids_change_if_uri_changes() -> None:
     assert ids_a.feature_id != ids_b.feature_id
 
 
+def test_stable_ids_expose_reverse_lookups_matching_keyed_ids() -> None:
+    ids = derive_stable_ids(_parse(FEATURE_TEXT, "./features/core/compiler.feature"))
+
+    (scenario_id,) = ids.scenario_ids.values()
+    assert ids.scenario_id_by_name == {"add": scenario_id}
+    assert set(ids.step_id_by_text) == {"a is 1", "I add 2", "result is 3"}
+    assert set(ids.step_id_by_text.values()) == set(ids.step_ids.values())
+    assert ids.step_id_by_scenario_and_text == {
+        (scenario_id, text): step_id for text, step_id in ids.step_id_by_text.items()
+    }
+
+
 def test_prediction_ids_are_deterministic() -> None:
     kwargs: dict[str, Any] = {
         "scope_key": "room:kitchen:light",
@@ -85,3 +99,72 @@ def test_prediction_ids_change_when_scope_changes() -> None:
     )
 
     assert base != changed
+
+
+def test_gherkin_document_skips_non_scenario_children_and_malformed_steps() -> None:
+    raw = {
+        "uri": "raw.feature",
+        "feature": {
+            "name": "Demo",
+            "children": [
+                {"background": {"steps": []}},
+                "not-a-child",
+                {"scenario": {"name": "only", "steps": [{"text": "go"}, None]}},
+            ],
+        },
+    }
+
+    doc = GherkinDocument.from_raw(raw)
+
+    assert doc is not None
+    assert doc.uri == "raw.feature"
+    assert [scenario.name for scenario in doc.feature.scenarios] == ["only"]
+    assert [step.text for step in doc.feature.scenarios[0].steps] == ["go"]
+    assert doc.feature.scenarios[0].steps[0].location.line is None
+
+    with pytest.raises(FrozenInstanceError):
+        doc.uri = "other.feature"  # type: ignore[misc]
+
+
+def test_derive_stable_ids_returns_independent_results_per_call() -> None:
+    uri = "./features/core/compiler.feature"
+    doc = _parse(FEATURE_TEXT, uri)
+
+    first = derive_stable_ids(doc)
+    first.scenario_id_by_name["add"] = "scn_tampered"
+    again = derive_stable_ids(doc)
+    other_uri = derive_stable_ids(doc, uri="./features/other.feature")
+
+    assert again is not first
+    assert again.scenario_id_by_name["add"] != "scn_tampered"
+    assert again.feature_id == first.feature_id
+    assert other_uri.feature_id != first.feature_id
+
+
+def test_stable_ids_are_pinned_to_the_canonical_json_digests() -> None:
+    ids = derive_stable_ids(_parse(FEATURE_TEXT, "./features/core/compiler.feature"))
+
+    assert ids.feature_id == (
+        "feat_9100f7a9c5b3f319e771edb932c5025da40ab8fd22d569232b18a09e45f944f1"
+    )
+    assert ids.scenario_ids == {
+        "Scenario:add@3:3": "scn_8b2007a88ba3b8bcf70d6abb6af8f548680bd0c9a6af50d906897f84131380bd"
+    }
+    assert ids.step_id_by_text["a is 1"] == (
+        "stp_3940782ecfd189144f173925a425f284fd0fe1e31151c07bd1576bfb6f769e5a"
+    )
+
+
+def test_prediction_ids_are_pinned_to_the_canonical_json_digest() -> None:
+    prediction_id = derive_prediction_id(
+        scope_key="room:kitchen",
+        horizon_iso="2026-01-01T00:05:00+00:00",
+        issued_at_iso="2026-01-01T00:00:00+00:00",
+        filtration_id="filt:\u00e9",
+        distribution_kind="bernoulli",
+        distribution_params={"p": 0.25, "labels": ["on", "off"]},
+    )
+
+    assert prediction_id == (
+        "pred_11876f2d24d89ee405a7a39e5c4cf1620c43a99128f062c38449ba94cac140f9"
+    )